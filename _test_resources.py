@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Shared setup for the test scripts: src/ on sys.path, AI brain, OCR, TTS engine and Qt application
+
+The quick checks only verify that libraries import and expose the expected API.
+Set HEIMDALL_INTEGRATION=1 to make them talk to the real display and speech driver.
+"""
+import asyncio
+import io
+import os
+import queue
+import sys
+from functools import lru_cache
+from pathlib import Path
+from unittest import mock
+
+SRC_PATH = str(Path(__file__).parent / "src")
+INTEGRATION = bool(os.environ.get("HEIMDALL_INTEGRATION"))
+TESS_POOL_SIZE = 2
+
+
+def use_src_path():
+    """Make the packages under src/ importable, once per process"""
+    if SRC_PATH not in sys.path:
+        sys.path.insert(0, SRC_PATH)
+
+
+@lru_cache(maxsize=None)
+def real_tts_engine():
+    """The pyttsx3 engine, initialized once per process (call it from the main thread)"""
+    import pyttsx3
+    return pyttsx3.init()
+
+
+@lru_cache(maxsize=None)
+def tts_engine():
+    """pyttsx3 engine for the quick checks, a stand-in outside integration runs"""
+    import pyttsx3
+    if not INTEGRATION:
+        engine = mock.MagicMock(spec=pyttsx3.Engine)
+        engine.getProperty.return_value = [mock.Mock()]
+        return engine
+    return real_tts_engine()
+
+
+@lru_cache(maxsize=None)
+def tess_api_pool():
+    """Long-lived tesserocr handles, so the language data is loaded only once"""
+    # One thread per handle; the pool provides the parallelism. Set before the
+    # import, while the OpenMP runtime can still pick it up
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    from tesserocr import PyTessBaseAPI
+    pool = queue.Queue()
+    for _ in range(TESS_POOL_SIZE):
+        pool.put(PyTessBaseAPI(lang="eng"))
+    return pool
+
+
+def has_tesserocr():
+    """True when tesserocr is installed and can load the English language data"""
+    try:
+        tess_api_pool()
+    except (ImportError, RuntimeError):
+        return False
+    return True
+
+
+def _tesserocr_text(image):
+    pool = tess_api_pool()
+    api = pool.get()
+    try:
+        api.SetImage(image)
+        return api.GetUTF8Text()
+    finally:
+        pool.put(api)
+
+
+async def ocr_text(image):
+    """OCR a PIL image without blocking the event loop"""
+    if has_tesserocr():
+        return await asyncio.to_thread(_tesserocr_text, image)
+    
+    import pytesseract
+    try:
+        import aiopytesseract
+    except ImportError:
+        aiopytesseract = None
+    
+    # aiopytesseract runs tesseract from PATH, so keep a configured binary on pytesseract
+    if aiopytesseract is None or pytesseract.pytesseract.tesseract_cmd != "tesseract":
+        return await asyncio.to_thread(pytesseract.image_to_string, image)
+    
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return await aiopytesseract.image_to_string(buffer.getvalue())
+
+
+_brain = None
+
+
+async def heimdall_brain():
+    """HeimdallBrain shared by every test in the process, initialized on first use"""
+    global _brain
+    if _brain is None:
+        from ai.heimdall_brain import HeimdallBrain
+        _brain = HeimdallBrain()
+    if not _brain.initialized:
+        await _brain.initialize()
+    return _brain
+
+
+@lru_cache(maxsize=None)
+def qt_app():
+    """Return the process-wide QApplication, creating it on first use"""
+    # No window is ever shown, so skip the windowing system plugin
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Shared Whisper model loader for the test scripts
+
+Set HEIMDALL_SKIP_WHISPER_LOAD=1 to only check that a Whisper backend is
+installed; the tests then get a stand-in model instead of the real weights.
+Downloaded weights are kept in ./cache/whisper (or HEIMDALL_WHISPER_CACHE) so
+later runs load them from disk.
+"""
+import os
+from functools import lru_cache
+from pathlib import Path
+from importlib.util import find_spec
+from unittest import mock
+
+WHISPER_CACHE_DIR = os.environ.get(
+    "HEIMDALL_WHISPER_CACHE", str(Path(__file__).parent / "cache" / "whisper")
+)
+
+
+@lru_cache(maxsize=None)
+def load_whisper(name="base"):
+    """Load a Whisper model once, preferring faster-whisper's int8 CPU backend"""
+    if os.environ.get("HEIMDALL_SKIP_WHISPER_LOAD"):
+        if find_spec("faster_whisper") is None and find_spec("whisper") is None:
+            raise ImportError("No Whisper backend installed")
+        return mock.Mock(name=f"whisper-{name}")
+
+    try:
+        from faster_whisper import WhisperModel
+        return WhisperModel(
+            name, device="cpu", compute_type="int8", download_root=WHISPER_CACHE_DIR
+        )
+    except ImportError:
+        import whisper
+        return whisper.load_model(name, download_root=WHISPER_CACHE_DIR)
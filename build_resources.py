@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Compile src/ui/resources.qrc into a resources_rc.py module PyQt6 can load
+
+PyQt6 ships no rcc of its own, so this runs pyside6-rcc (or Qt's rcc) and
+points the generated module's QtCore import at PyQt6 instead of PySide6.
+"""
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+UI_DIR = Path(__file__).parent / "src" / "ui"
+QRC_PATH = UI_DIR / "resources.qrc"
+OUTPUT_PATH = UI_DIR / "resources_rc.py"
+
+
+def find_rcc():
+    """Return the rcc command line, or None if no rcc is installed"""
+    if shutil.which("pyside6-rcc"):
+        return ["pyside6-rcc"]
+    if shutil.which("rcc"):
+        return ["rcc", "-g", "python"]
+    return None
+
+
+def main():
+    rcc = find_rcc()
+    if rcc is None:
+        print("❌ No rcc found. Install one with: pip install PySide6-Essentials")
+        return 1
+    
+    result = subprocess.run(rcc + [str(QRC_PATH)], capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"❌ rcc failed: {result.stderr.strip()}")
+        return 1
+    
+    source = result.stdout.replace("from PySide6 import QtCore", "from PyQt6 import QtCore")
+    if "from PyQt6 import QtCore" not in source:
+        print("❌ Unexpected rcc output: no QtCore import to rewrite")
+        return 1
+    
+    OUTPUT_PATH.write_text(source, encoding="utf-8")
+    print(f"✅ Wrote {OUTPUT_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Session-wide fixtures shared by the Heimdall test scripts
+"""
+import asyncio
+import inspect
+
+import pytest
+
+from _test_resources import qt_app, tts_engine as _tts_engine, use_src_path
+from _whisper_backend import load_whisper
+
+use_src_path()
+
+# Interactive or really drives the desktop; run these with python directly
+DESKTOP_SCRIPTS = {"test_screen_button.py", "test_enhanced_automation.py"}
+
+
+def pytest_collection_modifyitems(config, items):
+    skip = pytest.mark.skip(reason="drives the desktop; run the script with python")
+    for item in items:
+        if item.path.name in DESKTOP_SCRIPTS:
+            item.add_marker(skip)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Run the checks (async ones on a fresh event loop) and fail those returning False"""
+    check = pyfuncitem.obj
+    funcargs = pyfuncitem.funcargs
+    kwargs = {name: funcargs[name] for name in inspect.signature(check).parameters if name in funcargs}
+    result = check(**kwargs)
+    if inspect.iscoroutine(result):
+        result = asyncio.run(result)
+    assert result is not False, f"{pyfuncitem.name} reported failure"
+    return True
+
+
+@pytest.fixture(scope="session")
+def whisper_model():
+    """Whisper model loaded once for the whole run"""
+    return load_whisper()
+
+
+@pytest.fixture(scope="session")
+def tts_engine():
+    """pyttsx3 engine initialized once for the whole run"""
+    return _tts_engine()
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """The single QApplication shared by all GUI tests"""
+    return qt_app()
@@ -41,7 +41,7 @@ except ImportError as e:
         return default
     def set_setting(key, value):
         return True
-    def show_settings_dialog(parent=None):
+    def show_settings_dialog(parent=None, snapshot=None):
         pass
 
 # Import automation components
@@ -440,17 +440,18 @@ class HeimdallWindow(QMainWindow):
         global DEMO_SAFE_MODE
         
         if SETTINGS_AVAILABLE:
-            # Load all settings into instance variables
-            self.voice_output_enabled = get_setting('voice_output_enabled', True)
-            self.voice_input_enabled = get_setting('voice_input_enabled', True)
-            self.simulation_mode = get_setting('simulation_mode', True)
-            self.auto_analyze_ocr = get_setting('auto_analyze_ocr', True)
-            self.debug_mode = get_setting('debug_mode', False)
-            self.max_recording_duration = get_setting('max_recording_duration', 8)
-            self.auto_send_transcript = get_setting('auto_send_transcript', True)
+            # Load all settings into instance variables from one snapshot
+            self.settings = settings_manager.snapshot()
+            self.voice_output_enabled = self.settings.voice_output_enabled
+            self.voice_input_enabled = self.settings.voice_input_enabled
+            self.simulation_mode = self.settings.simulation_mode
+            self.auto_analyze_ocr = self.settings.auto_analyze_ocr
+            self.debug_mode = self.settings.debug_mode
+            self.max_recording_duration = self.settings.max_recording_duration
+            self.auto_send_transcript = self.settings.auto_send_transcript
             
             # Update global settings
-            DEMO_SAFE_MODE = get_setting('demo_safe_mode', True)
+            DEMO_SAFE_MODE = self.settings.demo_safe_mode
         else:
             # Fallback defaults
             self.voice_output_enabled = True
@@ -792,17 +793,21 @@ class HeimdallWindow(QMainWindow):
         if self.ai_worker:
             self.ai_worker.set_simulation_mode(checked)
         
-        if SETTINGS_AVAILABLE:
-            set_setting('simulation_mode', checked)
+        self.save_setting('simulation_mode', checked)
         
         mode_text = "ON (safe mode)" if checked else "OFF (real execution)"
         self.add_message(f"🔧 Simulation mode: {mode_text}", False)
     
+    def save_setting(self, key, value):
+        """Persist one setting and refresh the snapshot so later reads see it"""
+        if SETTINGS_AVAILABLE:
+            set_setting(key, value)
+            self.settings = settings_manager.snapshot()
+    
     def toggle_voice_output(self, checked):
         """Toggle voice output"""
         self.voice_output_enabled = checked
-        if SETTINGS_AVAILABLE:
-            set_setting('voice_output_enabled', checked)
+        self.save_setting('voice_output_enabled', checked)
         status = "enabled" if checked else "disabled"
         self.add_message(f"🔊 Voice output {status}", False)
     
@@ -1217,8 +1222,7 @@ The conversation history has been saved as a JSON file."""
         DEMO_SAFE_MODE = not DEMO_SAFE_MODE
         
         # Save to settings
-        if SETTINGS_AVAILABLE:
-            set_setting('demo_safe_mode', DEMO_SAFE_MODE)
+        self.save_setting('demo_safe_mode', DEMO_SAFE_MODE)
         
         # Update button appearance
         self.safe_mode_btn.setText("🔒 Safe Mode" if DEMO_SAFE_MODE else "🔓 Live Mode")
@@ -1254,7 +1258,9 @@ The conversation history has been saved as a JSON file."""
     def show_settings(self):
         """Show settings dialog"""
         if SETTINGS_AVAILABLE:
-            dialog_result = show_settings_dialog(self)
+            # Fresh snapshot, so the dialog cannot save back stale values
+            self.settings = settings_manager.snapshot()
+            dialog_result = show_settings_dialog(self, self.settings)
             if dialog_result:
                 # Reload settings after dialog closes
                 self.load_settings_from_db()
@@ -1275,7 +1281,7 @@ The conversation history has been saved as a JSON file."""
         
         # Update safe mode
         global DEMO_SAFE_MODE
-        DEMO_SAFE_MODE = get_setting('demo_safe_mode', True)
+        DEMO_SAFE_MODE = self.settings.demo_safe_mode
         
         # Update safe mode button
         self.safe_mode_btn.setText("🔒 Safe Mode" if DEMO_SAFE_MODE else "🔓 Live Mode")
@@ -1303,8 +1309,8 @@ The conversation history has been saved as a JSON file."""
                 self.safe_mode_banner.hide()
         
         # Update window size if needed
-        window_width = get_setting('window_width', 1000)
-        window_height = get_setting('window_height', 800)
+        window_width = self.settings.window_width
+        window_height = self.settings.window_height
         if self.width() != window_width or self.height() != window_height:
             self.resize(window_width, window_height)
     
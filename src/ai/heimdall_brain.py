@@ -23,7 +23,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 try:
-    from src.core.llm_wrapper import intent_and_reply
+    from src.core.llm_wrapper import intent_and_reply, intent_and_reply_async
 except ImportError as e:
     logger.error(f"Failed to import llm_wrapper: {e}")
     def intent_and_reply(text):
@@ -31,6 +31,8 @@ except ImportError as e:
             'reply': f"❌ LLM component missing: {str(e)}. Please check llm_wrapper module.",
             'intent': {'type': 'error', 'message': 'LLM not available'}
         }
+    async def intent_and_reply_async(text):
+        return intent_and_reply(text)
 
 try:
     from src.core.screen_analyzer import capture_fullscreen_and_ocr
@@ -172,7 +174,7 @@ class HeimdallBrain:
             
             # Test component availability
             try:
-                test_result = intent_and_reply("test")
+                test_result = await intent_and_reply_async("test")
                 if "❌" in str(test_result):
                     logger.warning("Some components may not be fully available")
             except Exception as test_error:
@@ -222,8 +224,8 @@ class HeimdallBrain:
                     'execution_result': demo_result
                 }
             
-            # Step 1: Get intent and reply from LLM
-            llm_result = intent_and_reply(text)
+            # Step 1: Get intent and reply from LLM (off the event loop)
+            llm_result = await intent_and_reply_async(text)
             reply = llm_result.get('reply', 'No response generated')
             intent = llm_result.get('intent', {'type': 'unknown'})
             
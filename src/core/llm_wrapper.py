@@ -3,39 +3,43 @@
 LLM Wrapper - Intent parsing and response generation with Ollama integration
 Handles natural language understanding and response generation
 """
+import asyncio
 import logging
 import subprocess
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
-def call_ollama(prompt: str, model: str = "llama3.2") -> str:
+# Shared prefix of every Ollama prompt. Keeping it byte-identical lets a loaded
+# model reuse its cached evaluation instead of re-reading it for each request.
+SYSTEM_PROMPT = """You are Heimdall, an AI assistant that helps users control their computer through voice and text commands. You can:
+
+1. Analyze screen content using OCR
+2. Click buttons and UI elements  
+3. Scroll and navigate pages
+4. Type text into fields
+5. Provide helpful responses
+
+When users ask for automation tasks, respond helpfully and indicate what action you'll take. Keep responses concise and friendly.
+
+User request: """
+
+def call_ollama(prompt: str, model: str = "llama3.2", json_format: bool = False) -> str:
     """
     Call Ollama LLM for intelligent responses
     
     Args:
         prompt: Input prompt for the LLM
         model: Ollama model to use
+        json_format: Constrain the response to valid JSON
         
     Returns:
         LLM response text
     """
     try:
         # Construct the full prompt with system context
-        system_prompt = """You are Heimdall, an AI assistant that helps users control their computer through voice and text commands. You can:
-
-1. Analyze screen content using OCR
-2. Click buttons and UI elements  
-3. Scroll and navigate pages
-4. Type text into fields
-5. Provide helpful responses
-
-When users ask for automation tasks, respond helpfully and indicate what action you'll take. Keep responses concise and friendly.
-
-User request: """
-        
-        full_prompt = system_prompt + prompt
+        full_prompt = SYSTEM_PROMPT + prompt
         
         # Call Ollama using subprocess with full path on Windows
         import platform
@@ -55,8 +59,9 @@ User request: """
                     ollama_cmd = path
                     break
         
+        format_args = ["--format", "json"] if json_format else []
         result = subprocess.run(
-            [ollama_cmd, "run", model, full_prompt],
+            [ollama_cmd, "run", model, *format_args, full_prompt],
             capture_output=True,
             text=True,
             encoding='utf-8',
@@ -123,6 +128,111 @@ def intent_and_reply(text: str) -> Dict[str, Any]:
             }
         }
 
+def intent_and_reply_batch(texts: List[str]) -> List[Dict[str, Any]]:
+    """
+    intent_and_reply for several commands with a single Ollama call
+    
+    Intents still come from the rule-based parser; Ollama writes all the
+    replies in one JSON response. Any reply it leaves out uses the fallback.
+    
+    Args:
+        texts: User input texts
+        
+    Returns:
+        One dict with 'reply' and 'intent' keys per input, in order
+    """
+    intents = [parse_intent_rules(text.lower().strip()) for text in texts]
+    
+    replies = []
+    numbered = "\n".join(f"{i}. {text}" for i, text in enumerate(texts, 1))
+    ollama_response = call_ollama(
+        'Answer each numbered request below. Respond with a JSON object '
+        '{"replies": [...]} holding one reply string per request, in order.\n' + numbered,
+        json_format=True
+    )
+    if ollama_response and not ollama_response.startswith("❌"):
+        try:
+            replies = json.loads(ollama_response).get("replies", [])
+        except (ValueError, AttributeError) as e:
+            logger.warning(f"Could not parse batched Ollama reply: {e}")
+        if not isinstance(replies, list):
+            logger.warning("Batched Ollama reply has no replies list")
+            replies = []
+    
+    results = []
+    for i, (text, intent) in enumerate(zip(texts, intents)):
+        reply = replies[i] if i < len(replies) else None
+        if not isinstance(reply, str) or not reply.strip():
+            reply = generate_fallback_reply(text, intent)
+        results.append({'reply': reply, 'intent': intent})
+    return results
+
+async def intent_and_reply_async(text: str) -> Dict[str, Any]:
+    """
+    intent_and_reply for callers running on an event loop
+    
+    The blocking Ollama call runs on a worker thread, so several
+    requests can be in flight at once (e.g. with asyncio.gather).
+    """
+    return await asyncio.to_thread(intent_and_reply, text)
+
+class AsyncBatchQueue:
+    """
+    Micro-batches concurrent intent_and_reply requests
+    
+    Requests arriving within max_wait_time of the first one (up to
+    max_batch_size) are answered together by intent_and_reply_batch.
+    """
+    
+    def __init__(self, max_batch_size: int = 8, max_wait_time: float = 0.05):
+        self.max_batch_size = max_batch_size
+        self.max_wait_time = max_wait_time
+        self._loop = None
+        self._queue = None
+        self._worker = None
+    
+    async def add_request(self, text: str) -> Dict[str, Any]:
+        """Queue one request and wait for its result"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker.done():
+            # First use on this event loop: start the collector there
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._process_batches())
+        
+        future = loop.create_future()
+        await self._queue.put((text, future))
+        return await future
+    
+    async def _collect_batch(self) -> List[tuple]:
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.max_wait_time
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+    
+    async def _process_batches(self):
+        while True:
+            batch = await self._collect_batch()
+            try:
+                results = await asyncio.to_thread(intent_and_reply_batch, [text for text, _ in batch])
+            except Exception as e:
+                logger.error(f"Batched intent_and_reply failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
 def parse_intent_rules(text_lower: str) -> Dict[str, Any]:
     """
     Parse intent using rule-based system for reliable automation detection
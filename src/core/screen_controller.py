@@ -235,6 +235,21 @@ def find_element_by_description(description: str) -> Optional[Tuple[int, int]]:
         Tuple of (x, y) coordinates if found, None otherwise
     """
     try:
+        # Look for common UI patterns based on description
+        description_lower = description.lower()
+        wants_close = any(word in description_lower for word in ['close', 'x button', 'exit'])
+        wants_minimize = any(word in description_lower for word in ['minimize', 'minimize button'])
+        wants_maximize = any(word in description_lower for word in ['maximize', 'maximize button'])
+        
+        # Handle specific Heimdall UI elements with direct action - no screenshot needed
+        if not (wants_close or wants_minimize or wants_maximize):
+            if any(word in description_lower for word in ['screen button', 'screen', 'camera button', '📸']):
+                # For Heimdall screen button, trigger screen reading directly
+                return "HEIMDALL_SCREEN_ACTION"  # Special return value to trigger screen reading
+            if any(word in description_lower for word in ['voice button', 'microphone', 'mic', '🎤']):
+                # For Heimdall voice button, trigger voice recording directly  
+                return "HEIMDALL_VOICE_ACTION"  # Special return value to trigger voice recording
+        
         # Take screenshot
         screenshot = pyautogui.screenshot()
         screenshot_np = np.array(screenshot)
@@ -242,24 +257,13 @@ def find_element_by_description(description: str) -> Optional[Tuple[int, int]]:
         # Convert to OpenCV format
         screenshot_cv = cv2.cvtColor(screenshot_np, cv2.COLOR_RGB2BGR)
         
-        # Look for common UI patterns based on description
-        description_lower = description.lower()
-        
         # Handle window control buttons (close, minimize, maximize)
-        if any(word in description_lower for word in ['close', 'x button', 'exit']):
+        if wants_close:
             return find_close_button(screenshot_cv)
-        elif any(word in description_lower for word in ['minimize', 'minimize button']):
+        elif wants_minimize:
             return find_minimize_button(screenshot_cv)
-        elif any(word in description_lower for word in ['maximize', 'maximize button']):
+        elif wants_maximize:
             return find_maximize_button(screenshot_cv)
-        
-        # Handle specific Heimdall UI elements with direct action
-        elif any(word in description_lower for word in ['screen button', 'screen', 'camera button', '📸']):
-            # For Heimdall screen button, trigger screen reading directly
-            return "HEIMDALL_SCREEN_ACTION"  # Special return value to trigger screen reading
-        elif any(word in description_lower for word in ['voice button', 'microphone', 'mic', '🎤']):
-            # For Heimdall voice button, trigger voice recording directly  
-            return "HEIMDALL_VOICE_ACTION"  # Special return value to trigger voice recording
         elif any(word in description_lower for word in ['send button', 'send']):
             return find_heimdall_send_button(screenshot_cv)
         
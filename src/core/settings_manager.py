@@ -6,12 +6,33 @@ Handles user preferences, configuration, and defaults
 import sqlite3
 import json
 import os
+from dataclasses import dataclass, fields
 from typing import Dict, Any, Optional
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """Read-only copy of the known settings, taken once and handed to the UI"""
+    simulation_mode: bool
+    voice_output_enabled: bool
+    voice_input_enabled: bool
+    demo_safe_mode: bool
+    auto_analyze_ocr: bool
+    whisper_model_size: str
+    tts_rate: int
+    tts_volume: float
+    max_recording_duration: int
+    auto_send_transcript: bool
+    theme: str
+    window_width: int
+    window_height: int
+    notify_minimize: bool
+    debug_mode: bool
+    log_level: str
+
 class SettingsManager:
     """Manages user settings with SQLite persistence"""
     
@@ -30,6 +51,7 @@ class SettingsManager:
         'theme': 'dark',
         'window_width': 1000,
         'window_height': 800,
+        'notify_minimize': True,
         'debug_mode': False,
         'log_level': 'INFO'
     }
@@ -37,6 +59,7 @@ class SettingsManager:
     def __init__(self, db_path: str = "data/heimdall.db"):
         self.db_path = db_path
         self.settings_cache = {}
+        self._snapshot = None  # cached SettingsSnapshot, cleared on every write
         self._ensure_db_exists()
         self._load_settings()
     
@@ -108,19 +131,35 @@ class SettingsManager:
     
     def _ensure_defaults(self):
         """Ensure all default settings exist in cache and database"""
-        for key, default_value in self.DEFAULT_SETTINGS.items():
-            if key not in self.settings_cache:
-                self.set(key, default_value, save_to_db=True)
+        missing = {key: default_value for key, default_value in self.DEFAULT_SETTINGS.items()
+                   if key not in self.settings_cache}
+        if missing:
+            self.set_many(missing)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get setting value"""
         return self.settings_cache.get(key, default)
     
+    def get_many(self, keys, defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Get several setting values at once, falling back to defaults"""
+        defaults = defaults or {}
+        return {key: self.settings_cache.get(key, defaults.get(key)) for key in keys}
+    
+    def snapshot(self) -> SettingsSnapshot:
+        """Get a frozen snapshot of the known settings, rebuilt only after changes"""
+        if self._snapshot is None:
+            self._snapshot = SettingsSnapshot(**{
+                field.name: self.settings_cache.get(field.name, self.DEFAULT_SETTINGS.get(field.name))
+                for field in fields(SettingsSnapshot)
+            })
+        return self._snapshot
+    
     def set(self, key: str, value: Any, save_to_db: bool = True, description: str = None) -> bool:
         """Set setting value"""
         try:
             old_value = self.settings_cache.get(key)
             self.settings_cache[key] = value
+            self._snapshot = None
             
             if save_to_db:
                 self._save_to_db(key, value, old_value, description)
@@ -131,46 +170,68 @@ class SettingsManager:
             logger.error(f"Failed to set setting {key}: {e}")
             return False
     
+    def set_many(self, updates: Dict[str, Any], description: str = None) -> bool:
+        """Set several settings in a single database transaction"""
+        try:
+            old_values = {key: self.settings_cache.get(key) for key in updates}
+            
+            with sqlite3.connect(self.db_path) as conn:
+                for key, value in updates.items():
+                    self._write_setting(conn, key, value, old_values[key], description)
+                conn.commit()
+            
+            self.settings_cache.update(updates)
+            self._snapshot = None
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to set settings {list(updates)}: {e}")
+            return False
+    
     def _save_to_db(self, key: str, value: Any, old_value: Any = None, description: str = None):
         """Save setting to database"""
         try:
-            # Determine value type and convert to string
-            if isinstance(value, bool):
-                value_str = str(value).lower()
-                value_type = 'bool'
-            elif isinstance(value, int):
-                value_str = str(value)
-                value_type = 'int'
-            elif isinstance(value, float):
-                value_str = str(value)
-                value_type = 'float'
-            elif isinstance(value, (dict, list)):
-                value_str = json.dumps(value)
-                value_type = 'json'
-            else:
-                value_str = str(value)
-                value_type = 'str'
-            
             with sqlite3.connect(self.db_path) as conn:
-                # Insert or update setting
-                conn.execute("""
-                    INSERT OR REPLACE INTO settings (key, value, value_type, description, updated_at)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (key, value_str, value_type, description, datetime.now().isoformat()))
-                
-                # Log to history
-                if old_value is not None:
-                    old_value_str = json.dumps(old_value) if isinstance(old_value, (dict, list)) else str(old_value)
-                    conn.execute("""
-                        INSERT INTO settings_history (key, old_value, new_value)
-                        VALUES (?, ?, ?)
-                    """, (key, old_value_str, value_str))
-                
+                self._write_setting(conn, key, value, old_value, description)
                 conn.commit()
                 
         except Exception as e:
             logger.error(f"Failed to save setting {key} to database: {e}")
     
+    def _write_setting(self, conn: sqlite3.Connection, key: str, value: Any,
+                       old_value: Any = None, description: str = None):
+        """Write one setting and its history row on an open connection"""
+        # Determine value type and convert to string
+        if isinstance(value, bool):
+            value_str = str(value).lower()
+            value_type = 'bool'
+        elif isinstance(value, int):
+            value_str = str(value)
+            value_type = 'int'
+        elif isinstance(value, float):
+            value_str = str(value)
+            value_type = 'float'
+        elif isinstance(value, (dict, list)):
+            value_str = json.dumps(value)
+            value_type = 'json'
+        else:
+            value_str = str(value)
+            value_type = 'str'
+        
+        # Insert or update setting
+        conn.execute("""
+            INSERT OR REPLACE INTO settings (key, value, value_type, description, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, (key, value_str, value_type, description, datetime.now().isoformat()))
+        
+        # Log to history
+        if old_value is not None:
+            old_value_str = json.dumps(old_value) if isinstance(old_value, (dict, list)) else str(old_value)
+            conn.execute("""
+                INSERT INTO settings_history (key, old_value, new_value)
+                VALUES (?, ?, ?)
+            """, (key, old_value_str, value_str))
+    
     def get_all(self) -> Dict[str, Any]:
         """Get all settings"""
         return self.settings_cache.copy()
@@ -182,6 +243,7 @@ class SettingsManager:
             
             # Clear cache and reload defaults
             self.settings_cache.clear()
+            self._snapshot = None
             
             # Clear database settings (keep history)
             with sqlite3.connect(self.db_path) as conn:
@@ -15,6 +15,18 @@ import urllib.error
 import certifi
 
 
+# Loaded Whisper models by size, shared by every caller in the process
+_whisper_models = {}
+
+
+def get_whisper_model(name: str = "base"):
+    """Load a Whisper model on first use and reuse it afterwards"""
+    model = _whisper_models.get(name)
+    if model is None:
+        model = _whisper_models[name] = whisper.load_model(name)
+    return model
+
+
 class VoiceHandler:
     def __init__(self, model_size: str = "base"):
         """Initialize with local Whisper model"""
@@ -37,7 +49,7 @@ class VoiceHandler:
                 logger.warning(f"Failed to set certifi SSL context: {e}")
 
             logger.info(f"Loading Whisper model: {self.model_size}")
-            self.model = whisper.load_model(self.model_size)
+            self.model = get_whisper_model(self.model_size)
             logger.info("Whisper model loaded successfully")
         except (urllib.error.URLError, ssl.SSLError) as e:
             logger.error(f"SSL error while loading Whisper model: {e}")
@@ -104,12 +116,8 @@ def record_and_transcribe() -> str:
         Transcribed text from audio recording
     """
     try:
-        import whisper
-        import tempfile
-        import os
-        
         # Load Whisper model (using base model for speed)
-        model = whisper.load_model("base")
+        model = get_whisper_model("base")
         
         # Record audio (simplified - would need proper audio recording)
         # For now, return a placeholder
@@ -5,7 +5,7 @@ from PyQt6.QtWidgets import (
     QWidget, QLabel, QPushButton, QFrame, QVBoxLayout, QHBoxLayout,
     QGraphicsDropShadowEffect, QProgressBar, QTextEdit
 )
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal, QRect
+from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal, QRect, QPoint
 from PyQt6.QtGui import QFont, QPixmap, QPainter, QColor, QIcon
 from datetime import datetime
 import math
@@ -31,8 +31,24 @@ class AnimatedButton(QPushButton):
         self.shadow.setOffset(0, 2)
         self.setGraphicsEffect(self.shadow)
         
+        # Press feedback: nudge down 1px and back (QSS has no transform support)
+        self.press_animation = QPropertyAnimation(self, b"pos")
+        self.press_animation.setDuration(120)
+        self.press_animation.setEasingCurve(QEasingCurve.Type.OutQuad)
+        self.pressed.connect(self.animate_press)
+        
         self.apply_style()
     
+    def animate_press(self):
+        """Play the press nudge from the button's current position"""
+        if self.press_animation.state() == QPropertyAnimation.State.Running:
+            return
+        origin = self.pos()
+        self.press_animation.setStartValue(origin)
+        self.press_animation.setKeyValueAt(0.5, origin + QPoint(0, 1))
+        self.press_animation.setEndValue(origin)
+        self.press_animation.start()
+    
     def apply_style(self):
         """Apply button styling"""
         if self.primary:
@@ -139,13 +155,40 @@ class StatusCard(QFrame):
                 break
 
 
+# Indicator colors per AI status
+INDICATOR_COLORS = {
+    "idle": "#95a5a6",
+    "listening": "#3498db",
+    "processing": "#f39c12",
+    "speaking": "#2ecc71",
+    "error": "#e74c3c"
+}
+_INDICATOR_QSS = {}
+
+
+def indicator_style(status, radius):
+    """Stylesheet for a status dot, formatted once per (status, radius)"""
+    key = (status, radius)
+    qss = _INDICATOR_QSS.get(key)
+    if qss is None:
+        color = INDICATOR_COLORS.get(status, INDICATOR_COLORS["idle"])
+        qss = _INDICATOR_QSS[key] = f"""
+            QLabel {{
+                background: {color};
+                border-radius: {radius}px;
+                border: 2px solid rgba(255, 255, 255, 0.3);
+            }}
+        """
+    return qss
+
+
 class PulsingIndicator(QLabel):
     """Animated pulsing indicator for AI status"""
     
     def __init__(self, size=16):
         super().__init__()
         self.setFixedSize(size, size)
-        self.status = "idle"
+        self.status = None
         
         # Animation setup
         self.animation = QPropertyAnimation(self, b"geometry")
@@ -157,25 +200,11 @@ class PulsingIndicator(QLabel):
     
     def update_status(self, status):
         """Update indicator status with color and animation"""
+        if status == self.status:
+            return  # same stylesheet and animation state, nothing to restyle
         self.status = status
         
-        colors = {
-            "idle": "#95a5a6",
-            "listening": "#3498db", 
-            "processing": "#f39c12",
-            "speaking": "#2ecc71",
-            "error": "#e74c3c"
-        }
-        
-        color = colors.get(status, "#95a5a6")
-        
-        self.setStyleSheet(f"""
-            QLabel {{
-                background: {color};
-                border-radius: {self.width() // 2}px;
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }}
-        """)
+        self.setStyleSheet(indicator_style(status, self.width() // 2))
         
         # Start animation for active states
         if status in ["listening", "processing", "speaking"]:
@@ -5,222 +5,361 @@ Built with PyQt6 with dark theme, gold/purple accents, and smooth animations
 import sys
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTextEdit, QLineEdit, QPushButton, QLabel, QFrame, QScrollArea,
+    QTextEdit, QLineEdit, QPushButton, QLabel, QFrame,
     QSplitter, QStackedWidget, QListWidget, QListWidgetItem, QSystemTrayIcon,
     QMenu, QToolButton, QSpacerItem, QSizePolicy, QGraphicsDropShadowEffect,
-    QGraphicsBlurEffect, QSlider, QCheckBox, QComboBox
+    QGraphicsBlurEffect, QSlider, QCheckBox, QComboBox,
+    QListView, QAbstractItemView, QStyledItemDelegate
 )
 from PyQt6.QtCore import (
-    Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal, QThread,
-    QSequentialAnimationGroup, QParallelAnimationGroup, QRect, QPoint, QSize
+    Qt, QTimer, pyqtSignal, QThread,
+    QSequentialAnimationGroup, QParallelAnimationGroup, QRect, QRectF, QPoint, QSize, QFile, QEvent,
+    QAbstractListModel, QModelIndex
 )
 from PyQt6.QtGui import (
     QFont, QPixmap, QPainter, QPainterPath, QColor, QLinearGradient,
-    QIcon, QAction, QPalette, QBrush, QPen, QRadialGradient
+    QIcon, QAction, QPalette, QBrush, QPen, QRadialGradient, QPixmapCache, QFontMetrics
 )
+from bisect import bisect_right
 from datetime import datetime
+from pathlib import Path
 import json
 import math
 
+from ..core.settings_manager import settings_manager
+from .settings_dialog import SettingsDialog
+from .styles import BREAKPOINTS, COLORS, ui_font
 
-class ModernMessageBubble(QFrame):
-    """Modern message bubble with Framer Motion styling"""
+# Compiled Qt resources (build step: python build_resources.py)
+try:
+    from . import resources_rc  # noqa: F401 - registers the ":/" resource paths
+except ImportError:
+    pass
+# Only trust the resources if they registered with this (PyQt6) QtCore
+HAS_RESOURCES = QFile.exists(":/heimdall.qss")
+
+ICON_PATH = ":/icons/heimdall_icon.png" if HAS_RESOURCES else "assets/heimdall_icon.png"
+
+# Window-level theme stylesheets toggled by HeimdallMainWindow.apply_theme
+_DARK_QSS = """
+    QMainWindow {
+        background: #2c3e50;
+        color: white;
+    }
+    QFrame {
+        background: #34495e;
+        color: white;
+    }
+    QLabel {
+        color: white;
+    }
+"""
+
+_LIGHT_QSS = """
+    QMainWindow {
+        background: white;
+        color: #333;
+    }
+"""
+
+# Responsive tiers: index into the sorted breakpoint widths
+_BP_WIDTHS = sorted(BREAKPOINTS.values())
+_DESKTOP_TIER = bisect_right(_BP_WIDTHS, BREAKPOINTS['desktop'])
+
+WELCOME_MESSAGE = (
+    "Hello! I'm Heimdall, your AI assistant. I can help you navigate your screen, "
+    "control applications, and answer questions. Try commands like 'Read what's on my screen' "
+    "or 'Click the blue button'."
+)
+
+# Sizes the window manager and system tray usually ask for
+ICON_SIZES = (16, 22, 24, 32, 48, 64)
+_ICON = None
+
+
+def heimdall_icon():
+    """Application icon, decoded once and shared by the window and tray"""
+    global _ICON
+    if _ICON is None:
+        pixmap = QPixmapCache.find("heimdall_icon")
+        if pixmap is None:
+            pixmap = QPixmap(ICON_PATH)
+            QPixmapCache.insert("heimdall_icon", pixmap)
+        
+        _ICON = QIcon(pixmap)
+        if not pixmap.isNull():
+            for size in ICON_SIZES:
+                _ICON.addPixmap(pixmap.scaled(
+                    size, size,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                ))
+    return _ICON
+
+
+def load_app_stylesheet():
+    """Read heimdall.qss from the compiled resources, or from disk in development"""
+    if HAS_RESOURCES:
+        qss_file = QFile(":/heimdall.qss")
+        if qss_file.open(QFile.OpenModeFlag.ReadOnly):
+            try:
+                return bytes(qss_file.readAll()).decode("utf-8")
+            finally:
+                qss_file.close()
     
-    def __init__(self, message, is_user=True, timestamp=None):
-        super().__init__()
-        self.message = message
-        self.is_user = is_user
-        self.timestamp = timestamp or datetime.now()
-        
-        self.setup_ui()
-        self.apply_animations()
+    qss_path = Path(__file__).parent / "heimdall.qss"
+    return qss_path.read_text(encoding="utf-8") if qss_path.exists() else ""
+
+
+def _linear_gradient(start, stop, x2, y2):
+    """Gradient in widget-relative coordinates, so one instance fits any size"""
+    gradient = QLinearGradient(0, 0, x2, y2)
+    gradient.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
+    gradient.setColorAt(0, QColor(start))
+    gradient.setColorAt(1, QColor(stop))
+    return gradient
+
+
+# Brand gradients for user bubbles and the AI avatar, built once and shared
+_USER_BUBBLE_BRUSH = QBrush(_linear_gradient(COLORS['primary'], COLORS['secondary'], 0, 1))
+_AVATAR_BRUSH = QBrush(_linear_gradient("#8b5cf6", "#d4af37", 1, 1))
+
+
+class ChatModel(QAbstractListModel):
+    """Chat history as plain (message, is_user, timestamp) rows"""
     
-    def setup_ui(self):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(20, 10, 20, 10)
-        
-        if not self.is_user:
-            # AI Avatar
-            avatar = QLabel("H")
-            avatar.setFixedSize(40, 40)
-            avatar.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            avatar.setStyleSheet("""
-                QLabel {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #8b5cf6, stop:1 #d4af37);
-                    border-radius: 20px;
-                    color: white;
-                    font-weight: bold;
-                    font-size: 16px;
-                }
-            """)
-            layout.addWidget(avatar)
-        
-        # Message container
-        message_container = QFrame()
-        message_container.setObjectName("message_bubble")
-        message_layout = QVBoxLayout(message_container)
-        message_layout.setContentsMargins(16, 12, 16, 12)
-        
-        # Message text
-        message_text = QLabel(self.message)
-        message_text.setObjectName("message_text")
-        message_text.setWordWrap(True)
-        message_text.setFont(QFont("Inter", 11))
-        
-        # Timestamp
-        time_text = QLabel(self.timestamp.strftime("%H:%M"))
-        time_text.setObjectName("message_time")
-        time_text.setFont(QFont("Inter", 9))
-        
-        message_layout.addWidget(message_text)
-        message_layout.addWidget(time_text)
-        
-        if self.is_user:
-            layout.addStretch()
-            layout.addWidget(message_container)
-        else:
-            layout.addWidget(message_container)
-            layout.addStretch()
-        
-        # Apply styles
-        from .modern_styles import get_message_bubble_style
-        message_container.setStyleSheet(get_message_bubble_style(self.is_user))
+    MessageRole = Qt.ItemDataRole.UserRole
     
-    def apply_animations(self):
-        """Apply entrance animations"""
-        # Fade in animation
-        self.opacity_effect = QGraphicsOpacityEffect()
-        self.setGraphicsEffect(self.opacity_effect)
-        
-        self.fade_animation = QPropertyAnimation(self.opacity_effect, b"opacity")
-        self.fade_animation.setDuration(300)
-        self.fade_animation.setStartValue(0.0)
-        self.fade_animation.setEndValue(1.0)
-        self.fade_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        
-        # Start animation
-        QTimer.singleShot(50, self.fade_animation.start)
+    def __init__(self, max_rows, parent=None):
+        super().__init__(parent)
+        self._max_rows = max_rows
+        self._messages = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._messages)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._messages[index.row()]
+        if role == self.MessageRole:
+            return row
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row[0]
+        return None
+    
+    def append(self, message, is_user=True, timestamp=None):
+        """Add a row at the end, dropping the oldest one once the history is full"""
+        if len(self._messages) >= self._max_rows:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            del self._messages[0]
+            self.endRemoveRows()
+        
+        row = len(self._messages)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._messages.append((message, is_user, timestamp or datetime.now()))
+        self.endInsertRows()
 
 
-class ChatMessage(QFrame):
-    """Individual chat message widget"""
+class ChatBubbleDelegate(QStyledItemDelegate):
+    """Paints chat rows as bubbles, so messages need no widgets of their own"""
     
-    def __init__(self, message, is_user=True, timestamp=None):
-        super().__init__()
-        self.message = message
-        self.is_user = is_user
-        self.timestamp = timestamp or datetime.now()
-        
-        self.setup_ui()
+    AVATAR_SIZE = 40
+    AVATAR_GAP = 12
+    MARGIN_X, MARGIN_Y = 20, 8
+    PADDING_X, PADDING_Y = 16, 12
+    RADIUS = 15
+    MAX_BUBBLE_RATIO = 0.7
+    MAX_CACHED_SIZES = 512
     
-    def setup_ui(self):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(20, 10, 20, 10)
-        
-        if not self.is_user:
-            # AI Avatar
-            avatar = QLabel()
-            avatar.setFixedSize(40, 40)
-            avatar.setStyleSheet("""
-                QLabel {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #667eea, stop:1 #764ba2);
-                    border-radius: 20px;
-                    color: white;
-                    font-weight: bold;
-                    font-size: 16px;
-                }
-            """)
-            avatar.setText("H")
-            avatar.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(avatar)
-        
-        # Message bubble
-        message_frame = QFrame()
-        message_layout = QVBoxLayout(message_frame)
-        message_layout.setContentsMargins(15, 10, 15, 10)
-        
-        # Message text
-        message_label = QLabel(self.message)
-        message_label.setWordWrap(True)
-        message_label.setFont(QFont("Segoe UI", 11))
-        
-        # Timestamp
-        time_label = QLabel(self.timestamp.strftime("%H:%M"))
-        time_label.setFont(QFont("Segoe UI", 9))
-        time_label.setStyleSheet("color: rgba(0, 0, 0, 0.5);")
-        
-        message_layout.addWidget(message_label)
-        message_layout.addWidget(time_label)
-        
-        if self.is_user:
-            message_frame.setStyleSheet("""
-                QFrame {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #667eea, stop:1 #764ba2);
-                    border-radius: 15px;
-                    color: white;
-                }
-            """)
-            message_label.setStyleSheet("color: white;")
-            time_label.setStyleSheet("color: rgba(255, 255, 255, 0.7);")
-            layout.addStretch()
-            layout.addWidget(message_frame)
+    _AI_BRUSH = QBrush(QColor(42, 42, 42))
+    _AI_PEN = QPen(QColor(255, 255, 255, 25))
+    _TEXT_COLOR = QColor("#ffffff")
+    _AI_TEXT_COLOR = QColor("#e5e5e5")
+    _TIME_COLOR = QColor(255, 255, 255, 150)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._text_font = QFont("Inter", 11)
+        self._time_font = QFont("Inter", 9)
+        self._avatar_font = QFont("Segoe UI", 12, QFont.Weight.Bold)
+        self._text_metrics = QFontMetrics(self._text_font)
+        self._time_metrics = QFontMetrics(self._time_font)
+        
+        # Text measurements per (message, is_user); only valid for one row width
+        self._sizes = {}
+        self._sizes_width = None
+    
+    def _measure(self, message, is_user, width):
+        """Return (text size, bubble size) for a message in a row of the given width"""
+        if width != self._sizes_width:
+            self._sizes.clear()
+            self._sizes_width = width
+        
+        key = (message, is_user)
+        sizes = self._sizes.get(key)
+        if sizes is None:
+            if len(self._sizes) >= self.MAX_CACHED_SIZES:
+                # Drop the oldest measurement; trimmed history rows never come back
+                del self._sizes[next(iter(self._sizes))]
+            available = width - 2 * self.MARGIN_X
+            if not is_user:
+                available -= self.AVATAR_SIZE + self.AVATAR_GAP
+            text_width = max(int(available * self.MAX_BUBBLE_RATIO) - 2 * self.PADDING_X, 1)
+            
+            text = self._text_metrics.boundingRect(
+                QRect(0, 0, text_width, 1_000_000), Qt.TextFlag.TextWordWrap, message
+            ).size()
+            time_width = self._time_metrics.horizontalAdvance("00:00")
+            bubble = QSize(
+                max(text.width(), time_width) + 2 * self.PADDING_X,
+                text.height() + 4 + self._time_metrics.height() + 2 * self.PADDING_Y
+            )
+            sizes = self._sizes[key] = (text, bubble)
+        return sizes
+    
+    def _row_width(self, option):
+        view = self.parent()
+        return view.viewport().width() if view is not None else option.rect.width()
+    
+    def sizeHint(self, option, index):
+        message, is_user, _timestamp = index.data(ChatModel.MessageRole)
+        width = self._row_width(option)
+        _text, bubble = self._measure(message, is_user, width)
+        height = max(bubble.height(), 0 if is_user else self.AVATAR_SIZE)
+        return QSize(width, height + 2 * self.MARGIN_Y)
+    
+    def paint(self, painter, option, index):
+        message, is_user, timestamp = index.data(ChatModel.MessageRole)
+        text, bubble_size = self._measure(message, is_user, self._row_width(option))
+        rect = QRectF(option.rect).adjusted(self.MARGIN_X, self.MARGIN_Y, -self.MARGIN_X, -self.MARGIN_Y)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        
+        if is_user:
+            bubble = QRectF(rect.right() - bubble_size.width(), rect.top(),
+                            bubble_size.width(), bubble_size.height())
+            brush, text_color = _USER_BUBBLE_BRUSH, self._TEXT_COLOR
         else:
-            message_frame.setStyleSheet("""
-                QFrame {
-                    background: rgba(0, 0, 0, 0.05);
-                    border-radius: 15px;
-                    border: 1px solid rgba(0, 0, 0, 0.1);
-                }
-            """)
-            layout.addWidget(message_frame)
-            layout.addStretch()
+            # Avatar circle with the shared gradient brush
+            avatar = QRectF(rect.left(), rect.top(), self.AVATAR_SIZE, self.AVATAR_SIZE)
+            painter.setBrush(_AVATAR_BRUSH)
+            painter.drawEllipse(avatar)
+            painter.setPen(self._TEXT_COLOR)
+            painter.setFont(self._avatar_font)
+            painter.drawText(avatar, Qt.AlignmentFlag.AlignCenter, "H")
+            
+            bubble = QRectF(avatar.right() + self.AVATAR_GAP, rect.top(),
+                            bubble_size.width(), bubble_size.height())
+            brush, text_color = self._AI_BRUSH, self._AI_TEXT_COLOR
+        
+        path = QPainterPath()
+        path.addRoundedRect(bubble, self.RADIUS, self.RADIUS)
+        painter.fillPath(path, brush)
+        if not is_user:
+            painter.strokePath(path, self._AI_PEN)
+        
+        # Message text and timestamp
+        text_rect = QRectF(bubble.left() + self.PADDING_X, bubble.top() + self.PADDING_Y,
+                           text.width(), text.height())
+        painter.setPen(text_color)
+        painter.setFont(self._text_font)
+        painter.drawText(text_rect, Qt.TextFlag.TextWordWrap, message)
+        
+        time_rect = QRectF(text_rect.left(), text_rect.bottom() + 4,
+                           bubble.width() - 2 * self.PADDING_X, self._time_metrics.height())
+        painter.setPen(self._TIME_COLOR)
+        painter.setFont(self._time_font)
+        painter.drawText(time_rect, Qt.AlignmentFlag.AlignLeft, timestamp.strftime("%H:%M"))
+        
+        painter.restore()
+
+
+# Status dot colors and their pre-rendered pixmaps, keyed by (status, dpr, dimmed)
+DOT_COLORS = {
+    "idle": "#95a5a6",
+    "listening": "#3498db",
+    "processing": "#f39c12",
+    "speaking": "#2ecc71"
+}
+DOT_PIXMAPS = {}
+
+
+def _make_dot(color, size, dpr=1.0, dimmed=False):
+    """Paint a radial-gradient status dot once into a pixmap"""
+    pixmap = QPixmap(round(size * dpr), round(size * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    base = QColor(color)
+    if dimmed:
+        base.setAlphaF(0.45)
+    
+    gradient = QRadialGradient(size / 2, size / 2, size / 2)
+    gradient.setColorAt(0.0, base.lighter(130))
+    gradient.setColorAt(1.0, base)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QBrush(gradient))
+    painter.drawEllipse(0, 0, size, size)
+    painter.end()
+    return pixmap
+
+
+def dot_pixmap(status, size=12, dpr=1.0, dimmed=False):
+    """Return the cached dot pixmap for a status, rendering it on first use"""
+    key = (status, size, dpr, dimmed)
+    pixmap = DOT_PIXMAPS.get(key)
+    if pixmap is None:
+        color = DOT_COLORS.get(status, DOT_COLORS["idle"])
+        pixmap = DOT_PIXMAPS[key] = _make_dot(color, size, dpr, dimmed)
+    return pixmap
 
 
 class StatusIndicator(QLabel):
     """AI status indicator with animations"""
     
+    PULSE_INTERVAL_MS = 500
+    
     def __init__(self):
         super().__init__()
         self.setFixedSize(12, 12)
-        self.status = "idle"  # idle, listening, processing, speaking
+        self.status = None  # idle, listening, processing, speaking
+        self._dimmed = False
         
-        self.animation = QPropertyAnimation(self, b"geometry")
-        self.animation.setDuration(1000)
-        self.animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        # Two-frame pixmap swap instead of repainting the gradient every frame
+        self.pulse_timer = QTimer(self)
+        self.pulse_timer.setInterval(self.PULSE_INTERVAL_MS)
+        self.pulse_timer.timeout.connect(self._toggle_pulse_frame)
         
         self.update_status("idle")
     
+    def _show_frame(self):
+        self.setPixmap(dot_pixmap(self.status, self.width(), self.devicePixelRatioF(), self._dimmed))
+    
     def update_status(self, status):
+        if status == self.status:
+            return  # keep the current frame and pulse phase
         self.status = status
-        colors = {
-            "idle": "#95a5a6",
-            "listening": "#3498db",
-            "processing": "#f39c12",
-            "speaking": "#2ecc71"
-        }
-        
-        self.setStyleSheet(f"""
-            QLabel {{
-                background: {colors.get(status, '#95a5a6')};
-                border-radius: 6px;
-            }}
-        """)
+        self._dimmed = False
+        self._show_frame()
         
         if status in ["listening", "processing"]:
             self.start_pulse_animation()
         else:
-            self.animation.stop()
+            self.pulse_timer.stop()
     
     def start_pulse_animation(self):
-        self.animation.finished.connect(self.reverse_animation)
-        self.animation.start()
+        if not self.pulse_timer.isActive():
+            self.pulse_timer.start()
     
-    def reverse_animation(self):
-        # Create pulsing effect
-        pass
+    def _toggle_pulse_frame(self):
+        self._dimmed = not self._dimmed
+        self._show_frame()
 
 
 class SidebarButton(QPushButton):
@@ -278,17 +417,47 @@ class HeimdallMainWindow(QMainWindow):
     message_sent = pyqtSignal(str)
     voice_command_received = pyqtSignal(str)
     
-    def __init__(self):
+    # Stacked widget page for each lower-cased navigation item
+    _VIEW_INDEX = {"chat": 0, "voice": 1, "screen": 2, "settings": 3}
+    
+    # Oldest chat messages are dropped once the history reaches this size
+    _max_history = 2000
+    
+    def __init__(self, snapshot=None):
         super().__init__()
+        # SettingsSnapshot taken once at startup; refreshed by on_settings_changed
+        self.settings = snapshot or settings_manager.snapshot()
         self.current_view = "chat"
-        self.messages = []
+        self.dark_mode = False
+        self._tray_icon = None  # built on first minimize/close, see tray_icon
+        self._minimize_notified = False  # tray message is shown once per session
+        self._minimized_text = self.tr("Application was minimized to tray")
+        self.setFont(ui_font())
+        
+        # Layout tier only changes when a breakpoint is crossed; resizes are
+        # coalesced so a drag re-evaluates it at most every 100 ms
+        self._tier = None
+        self._pending_width = 0
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setInterval(100)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._update_tier)
+        
+        # Shared stylesheet for all objectName-styled widgets, parsed once per app
+        app = QApplication.instance()
+        if app is not None and not app.styleSheet():
+            app.setStyleSheet(load_app_stylesheet())
+        
         self.setup_ui()
         self.setup_animations()
         self.apply_theme()
     
     def setup_ui(self):
+        # Build the whole tree with updates off so Qt polishes it once at the end
+        self.setUpdatesEnabled(False)
+        
         self.setWindowTitle("Heimdall AI Assistant")
-        self.setGeometry(100, 100, 1200, 800)
+        self.setGeometry(100, 100, self.settings.window_width, self.settings.window_height)
         self.setMinimumSize(900, 600)
         
         # Remove window frame for modern look
@@ -311,6 +480,9 @@ class HeimdallMainWindow(QMainWindow):
         
         # Create status bar
         self.create_status_bar()
+        
+        self.setUpdatesEnabled(True)
+        self.ensurePolished()
     
     def create_sidebar(self, parent_layout):
         """Create the modern sidebar navigation"""
@@ -319,8 +491,10 @@ class HeimdallMainWindow(QMainWindow):
         
         # Sidebar container
         sidebar = SlideInWidget(direction="left")
+        self.sidebar = sidebar
         sidebar.setObjectName("sidebar")
         sidebar.setFixedWidth(280)
+        sidebar.setUpdatesEnabled(False)
         sidebar.setStyleSheet(get_sidebar_style())
         
         sidebar_layout = QVBoxLayout(sidebar)
@@ -334,16 +508,9 @@ class HeimdallMainWindow(QMainWindow):
         
         # Animated logo icon
         logo_icon = QLabel("👁")
+        logo_icon.setObjectName("logo_icon")
         logo_icon.setFixedSize(48, 48)
         logo_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        logo_icon.setStyleSheet("""
-            QLabel {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #8b5cf6, stop:1 #d4af37);
-                border-radius: 12px;
-                font-size: 24px;
-            }
-        """)
         
         # Logo text
         logo_text_container = QVBoxLayout()
@@ -363,6 +530,7 @@ class HeimdallMainWindow(QMainWindow):
         
         # Connection status
         connection_frame = QFrame()
+        connection_frame.setObjectName("connection_frame")
         connection_layout = QHBoxLayout(connection_frame)
         connection_layout.setContentsMargins(12, 8, 12, 8)
         
@@ -375,14 +543,6 @@ class HeimdallMainWindow(QMainWindow):
         connection_layout.addWidget(connection_text)
         connection_layout.addStretch()
         
-        connection_frame.setStyleSheet("""
-            QFrame {
-                background: rgba(42, 42, 42, 0.6);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 8px;
-            }
-        """)
-        
         sidebar_layout.addWidget(connection_frame)
         
         # Navigation buttons
@@ -414,6 +574,7 @@ class HeimdallMainWindow(QMainWindow):
         
         # AI Status section
         ai_status_frame = QFrame()
+        ai_status_frame.setObjectName("ai_status_frame")
         ai_status_layout = QVBoxLayout(ai_status_frame)
         ai_status_layout.setContentsMargins(16, 12, 16, 12)
         
@@ -433,16 +594,9 @@ class HeimdallMainWindow(QMainWindow):
         ai_status_layout.addWidget(status_header)
         ai_status_layout.addLayout(status_info_layout)
         
-        ai_status_frame.setStyleSheet("""
-            QFrame {
-                background: rgba(42, 42, 42, 0.6);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 12px;
-            }
-        """)
-        
         sidebar_layout.addWidget(ai_status_frame)
         
+        sidebar.setUpdatesEnabled(True)
         parent_layout.addWidget(sidebar)
         
         # Animate sidebar entrance
@@ -478,6 +632,7 @@ class HeimdallMainWindow(QMainWindow):
         header = QFrame()
         header.setObjectName("header")
         header.setFixedHeight(80)
+        header.setUpdatesEnabled(False)
         header.setStyleSheet(get_header_style())
         
         header_layout = QHBoxLayout(header)
@@ -516,6 +671,7 @@ class HeimdallMainWindow(QMainWindow):
         settings_btn = AnimatedButton("⚙️")
         settings_btn.setFixedSize(44, 44)
         settings_btn.setStyleSheet(get_button_style("ghost"))
+        settings_btn.clicked.connect(self.open_settings_dialog)
         
         # Window controls
         minimize_btn = AnimatedButton("−")
@@ -536,6 +692,7 @@ class HeimdallMainWindow(QMainWindow):
         controls_layout.addWidget(close_btn)
         
         header_layout.addLayout(controls_layout)
+        header.setUpdatesEnabled(True)
         parent_layout.addWidget(header)
     
     def create_chat_view(self):
@@ -544,25 +701,39 @@ class HeimdallMainWindow(QMainWindow):
         from .animated_widgets import FadeInWidget, TypingIndicator
         
         chat_widget = FadeInWidget()
+        chat_widget.setUpdatesEnabled(False)
         chat_layout = QVBoxLayout(chat_widget)
         chat_layout.setContentsMargins(0, 0, 0, 0)
         chat_layout.setSpacing(0)
         
-        # Chat messages area
-        self.chat_scroll = QScrollArea()
-        self.chat_scroll.setObjectName("chat_scroll")
-        self.chat_scroll.setWidgetResizable(True)
-        self.chat_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarNever)
-        self.chat_scroll.setStyleSheet(get_chat_style())
+        # Chat messages area - rows live in the model and are painted by the
+        # delegate, so only the visible messages cost anything to draw
+        self.chat_model = ChatModel(self._max_history, self)
+        
+        self.chat_view = QListView()
+        self.chat_view.setObjectName("chat_view")
+        self.chat_view.setModel(self.chat_model)
+        self.chat_view.setItemDelegate(ChatBubbleDelegate(self.chat_view))
+        self.chat_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.chat_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.chat_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.chat_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.chat_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.chat_view.setStyleSheet(get_chat_style())
+        
+        # Follow new content only while the user is at the bottom of the chat
+        self._autoscroll = True
+        scrollbar = self.chat_view.verticalScrollBar()
+        scrollbar.rangeChanged.connect(self._on_range_changed)
+        scrollbar.valueChanged.connect(self._on_scroll_value_changed)
         
         self.chat_content = QWidget()
         self.chat_layout = QVBoxLayout(self.chat_content)
         self.chat_layout.setContentsMargins(32, 24, 32, 24)
         self.chat_layout.setSpacing(16)
-        self.chat_layout.addStretch()
+        self.chat_layout.addWidget(self.chat_view)
         
-        self.chat_scroll.setWidget(self.chat_content)
-        chat_layout.addWidget(self.chat_scroll)
+        chat_layout.addWidget(self.chat_content)
         
         # Typing indicator (hidden by default)
         self.typing_indicator = TypingIndicator()
@@ -585,16 +756,7 @@ class HeimdallMainWindow(QMainWindow):
         
         # Message input with modern styling
         input_wrapper = QFrame()
-        input_wrapper.setStyleSheet("""
-            QFrame {
-                background: rgba(42, 42, 42, 0.8);
-                border: 2px solid rgba(255, 255, 255, 0.1);
-                border-radius: 25px;
-            }
-            QFrame:focus-within {
-                border-color: #d4af37;
-            }
-        """)
+        input_wrapper.setObjectName("input_wrapper")
         
         input_wrapper_layout = QHBoxLayout(input_wrapper)
         input_wrapper_layout.setContentsMargins(4, 4, 4, 4)
@@ -602,35 +764,12 @@ class HeimdallMainWindow(QMainWindow):
         self.message_input = QLineEdit()
         self.message_input.setObjectName("message_input")
         self.message_input.setPlaceholderText("Type your message or command...")
-        self.message_input.setStyleSheet("""
-            QLineEdit {
-                background: transparent;
-                border: none;
-                padding: 12px 20px;
-                font-size: 16px;
-                color: white;
-            }
-            QLineEdit::placeholder {
-                color: #666666;
-            }
-        """)
         self.message_input.returnPressed.connect(self.send_message)
         
         # Voice button
         voice_input_btn = QPushButton("🎤")
+        voice_input_btn.setObjectName("voice_input_btn")
         voice_input_btn.setFixedSize(44, 44)
-        voice_input_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(139, 92, 246, 0.2);
-                border: 1px solid rgba(139, 92, 246, 0.3);
-                border-radius: 22px;
-                color: #8b5cf6;
-                font-size: 18px;
-            }
-            QPushButton:hover {
-                background: rgba(139, 92, 246, 0.3);
-            }
-        """)
         
         # Send button
         send_btn = QPushButton("Send")
@@ -662,15 +801,9 @@ class HeimdallMainWindow(QMainWindow):
         
         chat_layout.addWidget(input_container)
         
+        chat_widget.setUpdatesEnabled(True)
         self.stacked_widget.addWidget(chat_widget)
         
-        # Add welcome message
-        QTimer.singleShot(500, lambda: self.add_message(
-            "Hello! I'm Heimdall, your AI assistant. I can help you navigate your screen, "
-            "control applications, and answer questions. Try commands like 'Read what's on my screen' "
-            "or 'Click the blue button'.", False
-        ))
-        
         # Fade in the chat view
         QTimer.singleShot(100, chat_widget.fade_in)
     
@@ -697,23 +830,8 @@ class HeimdallMainWindow(QMainWindow):
         
         for icon, text in quick_actions:
             btn = QPushButton(f"{icon}\n{text}")
+            btn.setObjectName("quick_action_btn")
             btn.setFixedSize(160, 80)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: rgba(30, 30, 30, 0.8);
-                    border: 1px solid rgba(255, 255, 255, 0.1);
-                    border-radius: 12px;
-                    color: white;
-                    font-size: 12px;
-                    font-weight: 500;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 rgba(139, 92, 246, 0.2),
-                        stop:1 rgba(212, 175, 55, 0.2));
-                    border-color: #d4af37;
-                }
-            """)
             btn.clicked.connect(lambda checked, t=text: self.send_message_text(t))
             actions_grid.addWidget(btn)
         
@@ -775,6 +893,7 @@ class HeimdallMainWindow(QMainWindow):
     def create_settings_view(self):
         """Create settings view"""
         settings_widget = QWidget()
+        settings_widget.setUpdatesEnabled(False)
         settings_layout = QVBoxLayout(settings_widget)
         settings_layout.setContentsMargins(30, 30, 30, 30)
         
@@ -799,12 +918,20 @@ class HeimdallMainWindow(QMainWindow):
         settings_layout.addWidget(theme_frame)
         settings_layout.addStretch()
         
+        settings_widget.setUpdatesEnabled(True)
         self.stacked_widget.addWidget(settings_widget)
     
-    def setup_system_tray(self):
+    @property
+    def tray_icon(self):
+        """System tray icon, created the first time it is needed"""
+        if self._tray_icon is None:
+            self._build_tray()
+        return self._tray_icon
+    
+    def _build_tray(self):
         """Setup system tray icon"""
-        self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setIcon(QIcon("assets/heimdall_icon.png"))  # You'll need to add this
+        self._tray_icon = QSystemTrayIcon(self)
+        self._tray_icon.setIcon(heimdall_icon())
         
         tray_menu = QMenu()
         show_action = QAction("Show Heimdall", self)
@@ -817,51 +944,60 @@ class HeimdallMainWindow(QMainWindow):
         tray_menu.addSeparator()
         tray_menu.addAction(quit_action)
         
-        self.tray_icon.setContextMenu(tray_menu)
-        self.tray_icon.show()
+        self._tray_icon.setContextMenu(tray_menu)
+        self._tray_icon.show()
     
     def switch_view(self, view_name):
         """Switch between different views"""
-        # Update navigation buttons
+        # Update navigation buttons and header title
         for name, btn in self.nav_buttons.items():
-            btn.set_active(name == view_name)
-        
-        # Update header title
-        self.header_title.setText(view_name)
+            active = name.lower() == view_name
+            btn.setChecked(active)
+            if active:
+                self.header_title.setText(name)
         
         # Switch stacked widget
-        view_index = {
-            "Chat": 0,
-            "Voice Commands": 1,
-            "Screen Analysis": 2,
-            "Settings": 3
-        }.get(view_name, 0)
-        
-        self.stacked_widget.setCurrentIndex(view_index)
+        self.current_view = view_name
+        self.stacked_widget.setCurrentIndex(self._VIEW_INDEX.get(view_name, 0))
     
     def add_message(self, message, is_user=True):
         """Add a message to the chat"""
-        message_widget = ChatMessage(message, is_user)
-        
-        # Insert before the stretch
-        self.chat_layout.insertWidget(self.chat_layout.count() - 1, message_widget)
-        
-        # Scroll to bottom
-        QTimer.singleShot(100, self.scroll_to_bottom)
+        # _on_range_changed scrolls once the view has laid out the new row
+        self.chat_model.append(message, is_user)
     
     def scroll_to_bottom(self):
         """Scroll chat to bottom"""
-        scrollbar = self.chat_scroll.verticalScrollBar()
+        scrollbar = self.chat_view.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
     
+    def _on_range_changed(self, _minimum, maximum):
+        """Keep the chat pinned to the bottom as content is added"""
+        if self._autoscroll:
+            self.chat_view.verticalScrollBar().setValue(maximum)
+    
+    def _on_scroll_value_changed(self, value):
+        """Stop autoscrolling when the user scrolls up, resume at the bottom"""
+        self._autoscroll = value >= self.chat_view.verticalScrollBar().maximum()
+    
     def send_message(self):
         """Send a message"""
         text = self.message_input.text().strip()
         if text:
+            self._autoscroll = True
             self.add_message(text, True)
             self.message_input.clear()
             self.message_sent.emit(text)
     
+    def open_settings_dialog(self):
+        """Open the settings dialog on the current snapshot"""
+        dialog = SettingsDialog(self, self.settings)
+        dialog.settings_changed.connect(self.on_settings_changed)
+        dialog.exec()
+    
+    def on_settings_changed(self):
+        """Replace the stale snapshot after the settings dialog saved"""
+        self.settings = settings_manager.snapshot()
+    
     def toggle_voice_listening(self):
         """Toggle voice listening"""
         self.status_indicator.update_status("listening")
@@ -875,37 +1011,59 @@ class HeimdallMainWindow(QMainWindow):
     
     def apply_theme(self):
         """Apply the current theme"""
-        if self.dark_mode:
-            # Dark theme styles
-            self.setStyleSheet("""
-                QMainWindow {
-                    background: #2c3e50;
-                    color: white;
-                }
-                QFrame {
-                    background: #34495e;
-                    color: white;
-                }
-                QLabel {
-                    color: white;
-                }
-            """)
+        self.setStyleSheet(_DARK_QSS if self.dark_mode else _LIGHT_QSS)
+    
+    def resizeEvent(self, event):
+        """Queue a responsive tier check for the new width"""
+        super().resizeEvent(event)
+        self._pending_width = event.size().width()
+        if not self._resize_timer.isActive():
+            self._resize_timer.start()
+    
+    def _update_tier(self):
+        tier = bisect_right(_BP_WIDTHS, self._pending_width)
+        if tier != self._tier:
+            self._tier = tier
+            self._apply_tier(tier)
+    
+    def _apply_tier(self, tier):
+        """Switch between the compact and desktop layouts"""
+        if tier < _DESKTOP_TIER:
+            self.sidebar.setFixedWidth(220)
+            self.chat_layout.setContentsMargins(16, 16, 16, 16)
         else:
-            # Light theme (default)
-            self.setStyleSheet("""
-                QMainWindow {
-                    background: white;
-                    color: #333;
-                }
-            """)
+            self.sidebar.setFixedWidth(280)
+            self.chat_layout.setContentsMargins(32, 24, 32, 24)
+    
+    def showEvent(self, event):
+        """Post the welcome message the first time the window is shown"""
+        super().showEvent(event)
+        if not getattr(self, "_welcomed", False):
+            self._welcomed = True
+            QTimer.singleShot(0, self._post_welcome)
+    
+    def _post_welcome(self):
+        self.add_message(WELCOME_MESSAGE, False)
+    
+    def changeEvent(self, event):
+        """Create the tray icon the first time the window is minimized"""
+        if event.type() == QEvent.Type.WindowStateChange and self.isMinimized():
+            self.tray_icon
+        super().changeEvent(event)
     
     def closeEvent(self, event):
         """Handle close event - minimize to tray"""
         event.ignore()
         self.hide()
-        self.tray_icon.showMessage(
+        tray = self.tray_icon
+        
+        if (self._minimize_notified or not self.settings.notify_minimize
+                or not QSystemTrayIcon.supportsMessages()):
+            return
+        self._minimize_notified = True
+        tray.showMessage(
             "Heimdall",
-            "Application was minimized to tray",
+            self._minimized_text,
             QSystemTrayIcon.MessageIcon.Information,
             2000
         )
@@ -918,9 +1076,10 @@ def main():
     app.setQuitOnLastWindowClosed(False)
     
     # Set application icon
-    app.setWindowIcon(QIcon("assets/heimdall_icon.png"))
+    app.setWindowIcon(heimdall_icon())
     
-    window = HeimdallMainWindow()
+    # Read settings once; windows and dialogs share this snapshot
+    window = HeimdallMainWindow(snapshot=settings_manager.snapshot())
     window.show()
     
     return app.exec()
@@ -6,22 +6,144 @@ Provides a comprehensive settings interface with validation
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, 
                            QWidget, QLabel, QCheckBox, QSpinBox, QDoubleSpinBox,
                            QComboBox, QPushButton, QGroupBox, QFormLayout,
-                           QSlider, QMessageBox, QTextEdit, QScrollArea)
-from PyQt6.QtCore import Qt, pyqtSignal
+                           QSlider, QMessageBox, QTextEdit, QScrollArea, QFrame)
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker
 from PyQt6.QtGui import QFont
 
 from src.core.settings_manager import settings_manager
+from src.ui.styles import ui_font
+
+# Tab indices in the order they are added to the tab widget
+GENERAL_TAB, VOICE_TAB, AUTOMATION_TAB, ADVANCED_TAB = range(4)
+
+# Tooltips by widget attribute, applied once each tab's widgets exist
+_TOOLTIPS = {
+    'simulation_mode_cb': "When enabled, automation actions are simulated without execution",
+    'demo_safe_mode_cb': "Prevents all real automation execution",
+    'auto_analyze_ocr_cb': "Automatically analyze screen content with AI after OCR",
+    'debug_mode_cb': "Show additional debug information",
+    'notify_minimize_cb': "Show a tray message the first time the window is closed to the tray",
+    'voice_input_enabled_cb': "Allow voice recording and transcription",
+    'whisper_model_combo': "Whisper model size (larger = more accurate, slower)",
+    'max_recording_spin': "Maximum recording duration",
+    'auto_send_transcript_cb': "Automatically send transcribed text to AI",
+    'voice_output_enabled_cb': "Speak AI responses using text-to-speech",
+    'log_level_combo': "Set logging verbosity level",
+}
+
+# Dark theme for the whole dialog, shared by every SettingsDialog instance
+DIALOG_STYLESHEET = """
+    QDialog {
+        background: #0a0a0a;
+        color: white;
+    }
+    QTabWidget::pane {
+        border: 1px solid #333;
+        background: #1a1a1a;
+    }
+    QTabBar::tab {
+        background: #2a2a2a;
+        color: white;
+        padding: 8px 16px;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background: #d4af37;
+        color: black;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #333;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QLabel {
+        color: white;
+    }
+    QCheckBox {
+        color: white;
+        spacing: 8px;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QCheckBox::indicator:checked {
+        background: #d4af37;
+        border: 2px solid #b8860b;
+    }
+    QCheckBox::indicator:unchecked {
+        background: #3a3a3a;
+        border: 2px solid #555;
+    }
+    QComboBox, QSpinBox, QDoubleSpinBox {
+        background: #2a2a2a;
+        color: white;
+        border: 1px solid #555;
+        border-radius: 4px;
+        padding: 5px;
+    }
+    QSlider::groove:horizontal {
+        border: 1px solid #555;
+        height: 8px;
+        background: #2a2a2a;
+        border-radius: 4px;
+    }
+    QSlider::handle:horizontal {
+        background: #d4af37;
+        border: 1px solid #b8860b;
+        width: 18px;
+        margin: -2px 0;
+        border-radius: 9px;
+    }
+    QFrame#confirm_bar {
+        background: #2a2a2a;
+        border: 1px solid #FF6B6B;
+        border-radius: 8px;
+    }
+    QPushButton#reset_btn, QPushButton#cancel_btn, QPushButton#save_btn,
+    QPushButton#confirm_yes_btn, QPushButton#confirm_no_btn {
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-weight: bold;
+    }
+    QPushButton#reset_btn, QPushButton#confirm_yes_btn { background: #FF6B6B; }
+    QPushButton#reset_btn:hover, QPushButton#confirm_yes_btn:hover { background: #FF5252; }
+    QPushButton#cancel_btn, QPushButton#confirm_no_btn { background: #666; }
+    QPushButton#cancel_btn:hover, QPushButton#confirm_no_btn:hover { background: #777; }
+    QPushButton#save_btn { background: #4CAF50; }
+    QPushButton#save_btn:hover { background: #45a049; }
+"""
+
 
 class SettingsDialog(QDialog):
     """Settings dialog with tabbed interface"""
     
     settings_changed = pyqtSignal()  # Emitted when settings are saved
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, snapshot=None):
         super().__init__(parent)
+        self._snapshot = snapshot  # SettingsSnapshot to load from, taken at startup
         self.setWindowTitle("Heimdall Settings")
         self.setModal(True)
         self.setFixedSize(600, 500)
+        self.setFont(ui_font())
+        
+        # Coalesces slider label updates to at most one per frame while dragging
+        self._pending_labels = {}
+        self._label_update_timer = QTimer(self)
+        self._label_update_timer.setInterval(16)
+        self._label_update_timer.setSingleShot(True)
+        self._label_update_timer.timeout.connect(self._flush_labels)
+        
         self.setup_ui()
         self.load_settings()
     
@@ -32,57 +154,55 @@ class SettingsDialog(QDialog):
         # Create tab widget
         self.tab_widget = QTabWidget()
         
-        # Create tabs
+        # Create tabs - only General is built up front, the others are
+        # placeholders filled in by on_tab_changed the first time they are shown
         self.create_general_tab()
-        self.create_voice_tab()
-        self.create_automation_tab()
-        self.create_advanced_tab()
+        self._pending_tooltips = dict(_TOOLTIPS)
+        self._apply_tooltips()
+        self._lazy_tabs = {
+            VOICE_TAB: (self.create_voice_tab, self._load_voice),
+            AUTOMATION_TAB: (self.create_automation_tab, None),
+            ADVANCED_TAB: (self.create_advanced_tab, self._load_advanced),
+        }
+        for title in ("Voice", "Automation", "Advanced"):
+            self.tab_widget.addTab(QWidget(), title)
+        self._built = {GENERAL_TAB}
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
         layout.addWidget(self.tab_widget)
         
+        # Inline reset confirmation (hidden until Reset is clicked)
+        self._confirm_bar = QFrame()
+        self._confirm_bar.setObjectName("confirm_bar")
+        confirm_layout = QHBoxLayout(self._confirm_bar)
+        confirm_layout.addWidget(QLabel("Reset all settings to defaults? This action cannot be undone."))
+        confirm_layout.addStretch()
+        
+        confirm_yes_btn = QPushButton("Yes, reset")
+        confirm_yes_btn.setObjectName("confirm_yes_btn")
+        confirm_yes_btn.clicked.connect(self._really_reset)
+        confirm_no_btn = QPushButton("No")
+        confirm_no_btn.setObjectName("confirm_no_btn")
+        confirm_no_btn.clicked.connect(self._confirm_bar.hide)
+        
+        confirm_layout.addWidget(confirm_no_btn)
+        confirm_layout.addWidget(confirm_yes_btn)
+        self._confirm_bar.hide()
+        layout.addWidget(self._confirm_bar)
+        
         # Buttons
         button_layout = QHBoxLayout()
         
         self.reset_btn = QPushButton("🔄 Reset to Defaults")
-        self.reset_btn.setStyleSheet("""
-            QPushButton {
-                background: #FF6B6B;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background: #FF5252; }
-        """)
+        self.reset_btn.setObjectName("reset_btn")
         self.reset_btn.clicked.connect(self.reset_to_defaults)
         
         self.cancel_btn = QPushButton("Cancel")
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                background: #666;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background: #777; }
-        """)
+        self.cancel_btn.setObjectName("cancel_btn")
         self.cancel_btn.clicked.connect(self.reject)
         
         self.save_btn = QPushButton("💾 Save Settings")
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background: #45a049; }
-        """)
+        self.save_btn.setObjectName("save_btn")
         self.save_btn.clicked.connect(self.save_settings)
         
         button_layout.addWidget(self.reset_btn)
@@ -92,78 +212,8 @@ class SettingsDialog(QDialog):
         
         layout.addLayout(button_layout)
         
-        # Apply dark theme
-        self.setStyleSheet("""
-            QDialog {
-                background: #0a0a0a;
-                color: white;
-            }
-            QTabWidget::pane {
-                border: 1px solid #333;
-                background: #1a1a1a;
-            }
-            QTabBar::tab {
-                background: #2a2a2a;
-                color: white;
-                padding: 8px 16px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background: #d4af37;
-                color: black;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #333;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QLabel {
-                color: white;
-            }
-            QCheckBox {
-                color: white;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:checked {
-                background: #d4af37;
-                border: 2px solid #b8860b;
-            }
-            QCheckBox::indicator:unchecked {
-                background: #3a3a3a;
-                border: 2px solid #555;
-            }
-            QComboBox, QSpinBox, QDoubleSpinBox {
-                background: #2a2a2a;
-                color: white;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 5px;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #555;
-                height: 8px;
-                background: #2a2a2a;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #d4af37;
-                border: 1px solid #b8860b;
-                width: 18px;
-                margin: -2px 0;
-                border-radius: 9px;
-            }
-        """)
+        # Apply dark theme (one stylesheet for the dialog and its buttons)
+        self.setStyleSheet(DIALOG_STYLESHEET)
     
     def create_general_tab(self):
         """Create general settings tab"""
@@ -175,19 +225,15 @@ class SettingsDialog(QDialog):
         ui_layout = QFormLayout(ui_group)
         
         self.simulation_mode_cb = QCheckBox("Enable Simulation Mode (Safe)")
-        self.simulation_mode_cb.setToolTip("When enabled, automation actions are simulated without execution")
         ui_layout.addRow("Automation:", self.simulation_mode_cb)
         
         self.demo_safe_mode_cb = QCheckBox("Demo Safe Mode")
-        self.demo_safe_mode_cb.setToolTip("Prevents all real automation execution")
         ui_layout.addRow("Safety:", self.demo_safe_mode_cb)
         
         self.auto_analyze_ocr_cb = QCheckBox("Auto-analyze OCR Results")
-        self.auto_analyze_ocr_cb.setToolTip("Automatically analyze screen content with AI after OCR")
         ui_layout.addRow("Screen Reading:", self.auto_analyze_ocr_cb)
         
         self.debug_mode_cb = QCheckBox("Enable Debug Mode")
-        self.debug_mode_cb.setToolTip("Show additional debug information")
         ui_layout.addRow("Debug:", self.debug_mode_cb)
         
         layout.addWidget(ui_group)
@@ -206,14 +252,16 @@ class SettingsDialog(QDialog):
         self.window_height_spin.setSuffix(" px")
         window_layout.addRow("Height:", self.window_height_spin)
         
+        self.notify_minimize_cb = QCheckBox("Notify when minimized to tray")
+        window_layout.addRow("Tray:", self.notify_minimize_cb)
+        
         layout.addWidget(window_group)
         
         layout.addStretch()
         self.tab_widget.addTab(tab, "General")
     
-    def create_voice_tab(self):
+    def create_voice_tab(self, tab):
         """Create voice settings tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Voice Input
@@ -221,22 +269,18 @@ class SettingsDialog(QDialog):
         input_layout = QFormLayout(input_group)
         
         self.voice_input_enabled_cb = QCheckBox("Enable Voice Input")
-        self.voice_input_enabled_cb.setToolTip("Allow voice recording and transcription")
         input_layout.addRow("Microphone:", self.voice_input_enabled_cb)
         
         self.whisper_model_combo = QComboBox()
         self.whisper_model_combo.addItems(['tiny', 'base', 'small', 'medium', 'large'])
-        self.whisper_model_combo.setToolTip("Whisper model size (larger = more accurate, slower)")
         input_layout.addRow("Model Size:", self.whisper_model_combo)
         
         self.max_recording_spin = QSpinBox()
         self.max_recording_spin.setRange(1, 30)
         self.max_recording_spin.setSuffix(" seconds")
-        self.max_recording_spin.setToolTip("Maximum recording duration")
         input_layout.addRow("Max Duration:", self.max_recording_spin)
         
         self.auto_send_transcript_cb = QCheckBox("Auto-send Transcript")
-        self.auto_send_transcript_cb.setToolTip("Automatically send transcribed text to AI")
         input_layout.addRow("Auto-send:", self.auto_send_transcript_cb)
         
         layout.addWidget(input_group)
@@ -246,7 +290,6 @@ class SettingsDialog(QDialog):
         output_layout = QFormLayout(output_group)
         
         self.voice_output_enabled_cb = QCheckBox("Enable Voice Output")
-        self.voice_output_enabled_cb.setToolTip("Speak AI responses using text-to-speech")
         output_layout.addRow("Speaker:", self.voice_output_enabled_cb)
         
         # TTS Rate
@@ -254,7 +297,7 @@ class SettingsDialog(QDialog):
         self.tts_rate_slider = QSlider(Qt.Orientation.Horizontal)
         self.tts_rate_slider.setRange(50, 300)
         self.tts_rate_label = QLabel("150")
-        self.tts_rate_slider.valueChanged.connect(lambda v: self.tts_rate_label.setText(str(v)))
+        self.tts_rate_slider.valueChanged.connect(lambda v: self._queue_label(self.tts_rate_label, str(v)))
         rate_layout.addWidget(self.tts_rate_slider)
         rate_layout.addWidget(self.tts_rate_label)
         output_layout.addRow("Speech Rate:", rate_layout)
@@ -264,7 +307,7 @@ class SettingsDialog(QDialog):
         self.tts_volume_slider = QSlider(Qt.Orientation.Horizontal)
         self.tts_volume_slider.setRange(0, 100)
         self.tts_volume_label = QLabel("80%")
-        self.tts_volume_slider.valueChanged.connect(lambda v: self.tts_volume_label.setText(f"{v}%"))
+        self.tts_volume_slider.valueChanged.connect(lambda v: self._queue_label(self.tts_volume_label, f"{v}%"))
         volume_layout.addWidget(self.tts_volume_slider)
         volume_layout.addWidget(self.tts_volume_label)
         output_layout.addRow("Volume:", volume_layout)
@@ -272,11 +315,9 @@ class SettingsDialog(QDialog):
         layout.addWidget(output_group)
         
         layout.addStretch()
-        self.tab_widget.addTab(tab, "Voice")
     
-    def create_automation_tab(self):
+    def create_automation_tab(self, tab):
         """Create automation settings tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Safety Settings
@@ -294,11 +335,9 @@ class SettingsDialog(QDialog):
         layout.addWidget(safety_group)
         
         layout.addStretch()
-        self.tab_widget.addTab(tab, "Automation")
     
-    def create_advanced_tab(self):
+    def create_advanced_tab(self, tab):
         """Create advanced settings tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Logging
@@ -307,7 +346,6 @@ class SettingsDialog(QDialog):
         
         self.log_level_combo = QComboBox()
         self.log_level_combo.addItems(['DEBUG', 'INFO', 'WARNING', 'ERROR'])
-        self.log_level_combo.setToolTip("Set logging verbosity level")
         logging_layout.addRow("Log Level:", self.log_level_combo)
         
         layout.addWidget(logging_group)
@@ -325,36 +363,92 @@ class SettingsDialog(QDialog):
         layout.addWidget(info_group)
         
         layout.addStretch()
-        self.tab_widget.addTab(tab, "Advanced")
+    
+    def _queue_label(self, label, text):
+        """Remember the latest text for a label and schedule a flush"""
+        self._pending_labels[label] = text
+        if not self._label_update_timer.isActive():
+            self._label_update_timer.start()
+    
+    def _flush_labels(self):
+        """Apply the queued slider label texts"""
+        for label, text in self._pending_labels.items():
+            label.setText(text)
+        self._pending_labels.clear()
+    
+    def on_tab_changed(self, index):
+        """Build and populate a lazy tab the first time it becomes visible"""
+        if index in self._built or index not in self._lazy_tabs:
+            return
+        
+        self._built.add(index)
+        builder, loader = self._lazy_tabs[index]
+        builder(self.tab_widget.widget(index))
+        self._apply_tooltips()
+        if loader:
+            self._populate(loader)
+    
+    def _apply_tooltips(self):
+        """Set the tooltips of every widget built since the last call"""
+        for name in [name for name in self._pending_tooltips if hasattr(self, name)]:
+            getattr(self, name).setToolTip(self._pending_tooltips.pop(name))
     
     def load_settings(self):
-        """Load current settings into UI"""
-        # General tab
-        self.simulation_mode_cb.setChecked(settings_manager.get('simulation_mode', True))
-        self.demo_safe_mode_cb.setChecked(settings_manager.get('demo_safe_mode', True))
-        self.auto_analyze_ocr_cb.setChecked(settings_manager.get('auto_analyze_ocr', True))
-        self.debug_mode_cb.setChecked(settings_manager.get('debug_mode', False))
-        self.window_width_spin.setValue(settings_manager.get('window_width', 1000))
-        self.window_height_spin.setValue(settings_manager.get('window_height', 800))
-        
-        # Voice tab
-        self.voice_input_enabled_cb.setChecked(settings_manager.get('voice_input_enabled', True))
-        self.voice_output_enabled_cb.setChecked(settings_manager.get('voice_output_enabled', True))
-        
-        model_size = settings_manager.get('whisper_model_size', 'base')
-        index = self.whisper_model_combo.findText(model_size)
+        """Load current settings into the tabs that have been built"""
+        loaders = [self._load_general]
+        if VOICE_TAB in self._built:
+            loaders.append(self._load_voice)
+        if ADVANCED_TAB in self._built:
+            loaders.append(self._load_advanced)
+        self._populate(*loaders)
+    
+    def _populate(self, *loaders):
+        """Run tab loaders with input signals blocked and one repaint at the end"""
+        if self._snapshot is None:
+            self._snapshot = settings_manager.snapshot()
+        snap = self._snapshot
+        inputs = self.tab_widget.findChildren((QCheckBox, QSpinBox, QComboBox, QSlider))
+        blockers = [QSignalBlocker(widget) for widget in inputs]
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            for loader in loaders:
+                loader(snap)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            self.tab_widget.setUpdatesEnabled(True)
+    
+    def _load_general(self, snap):
+        """Load General tab settings"""
+        self.simulation_mode_cb.setChecked(snap.simulation_mode)
+        self.demo_safe_mode_cb.setChecked(snap.demo_safe_mode)
+        self.auto_analyze_ocr_cb.setChecked(snap.auto_analyze_ocr)
+        self.debug_mode_cb.setChecked(snap.debug_mode)
+        self.window_width_spin.setValue(snap.window_width)
+        self.window_height_spin.setValue(snap.window_height)
+        self.notify_minimize_cb.setChecked(snap.notify_minimize)
+    
+    def _load_voice(self, snap):
+        """Load Voice tab settings"""
+        self.voice_input_enabled_cb.setChecked(snap.voice_input_enabled)
+        self.voice_output_enabled_cb.setChecked(snap.voice_output_enabled)
+        
+        index = self.whisper_model_combo.findText(snap.whisper_model_size)
         if index >= 0:
             self.whisper_model_combo.setCurrentIndex(index)
         
-        self.max_recording_spin.setValue(settings_manager.get('max_recording_duration', 8))
-        self.auto_send_transcript_cb.setChecked(settings_manager.get('auto_send_transcript', True))
-        
-        self.tts_rate_slider.setValue(int(settings_manager.get('tts_rate', 150)))
-        self.tts_volume_slider.setValue(int(settings_manager.get('tts_volume', 0.8) * 100))
+        self.max_recording_spin.setValue(snap.max_recording_duration)
+        self.auto_send_transcript_cb.setChecked(snap.auto_send_transcript)
         
-        # Advanced tab
-        log_level = settings_manager.get('log_level', 'INFO')
-        index = self.log_level_combo.findText(log_level)
+        # Slider signals are blocked while loading, so set the labels directly
+        self.tts_rate_slider.setValue(int(snap.tts_rate))
+        self.tts_rate_label.setText(str(self.tts_rate_slider.value()))
+        self.tts_volume_slider.setValue(int(snap.tts_volume * 100))
+        self.tts_volume_label.setText(f"{self.tts_volume_slider.value()}%")
+    
+    def _load_advanced(self, snap):
+        """Load Advanced tab settings"""
+        index = self.log_level_combo.findText(snap.log_level)
         if index >= 0:
             self.log_level_combo.setCurrentIndex(index)
     
@@ -362,55 +456,65 @@ class SettingsDialog(QDialog):
         """Save settings and close dialog"""
         try:
             # General settings
-            settings_manager.set('simulation_mode', self.simulation_mode_cb.isChecked())
-            settings_manager.set('demo_safe_mode', self.demo_safe_mode_cb.isChecked())
-            settings_manager.set('auto_analyze_ocr', self.auto_analyze_ocr_cb.isChecked())
-            settings_manager.set('debug_mode', self.debug_mode_cb.isChecked())
-            settings_manager.set('window_width', self.window_width_spin.value())
-            settings_manager.set('window_height', self.window_height_spin.value())
+            updates = {
+                'simulation_mode': self.simulation_mode_cb.isChecked(),
+                'demo_safe_mode': self.demo_safe_mode_cb.isChecked(),
+                'auto_analyze_ocr': self.auto_analyze_ocr_cb.isChecked(),
+                'debug_mode': self.debug_mode_cb.isChecked(),
+                'window_width': self.window_width_spin.value(),
+                'window_height': self.window_height_spin.value(),
+                'notify_minimize': self.notify_minimize_cb.isChecked(),
+            }
             
-            # Voice settings
-            settings_manager.set('voice_input_enabled', self.voice_input_enabled_cb.isChecked())
-            settings_manager.set('voice_output_enabled', self.voice_output_enabled_cb.isChecked())
-            settings_manager.set('whisper_model_size', self.whisper_model_combo.currentText())
-            settings_manager.set('max_recording_duration', self.max_recording_spin.value())
-            settings_manager.set('auto_send_transcript', self.auto_send_transcript_cb.isChecked())
-            settings_manager.set('tts_rate', self.tts_rate_slider.value())
-            settings_manager.set('tts_volume', self.tts_volume_slider.value() / 100.0)
+            # Voice settings (tabs that were never opened keep their stored values)
+            if VOICE_TAB in self._built:
+                updates.update({
+                    'voice_input_enabled': self.voice_input_enabled_cb.isChecked(),
+                    'voice_output_enabled': self.voice_output_enabled_cb.isChecked(),
+                    'whisper_model_size': self.whisper_model_combo.currentText(),
+                    'max_recording_duration': self.max_recording_spin.value(),
+                    'auto_send_transcript': self.auto_send_transcript_cb.isChecked(),
+                    'tts_rate': self.tts_rate_slider.value(),
+                    'tts_volume': self.tts_volume_slider.value() / 100.0,
+                })
             
             # Advanced settings
-            settings_manager.set('log_level', self.log_level_combo.currentText())
+            if ADVANCED_TAB in self._built:
+                updates['log_level'] = self.log_level_combo.currentText()
             
-            # Emit signal that settings changed
-            self.settings_changed.emit()
+            # Write everything in one transaction
+            if not settings_manager.set_many(updates):
+                raise RuntimeError("could not write settings to the database")
             
-            # Show success message
-            QMessageBox.information(self, "Settings Saved", "Settings have been saved successfully!")
+            # Emit signal that settings changed (the old snapshot is now stale)
+            self._snapshot = None
+            self.settings_changed.emit()
             
+            # Close first, then confirm on the parent once it has repainted
             self.accept()
+            QTimer.singleShot(0, lambda parent=self.parent(): QMessageBox.information(
+                parent, "Settings Saved", "Settings have been saved successfully!"
+            ))
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save settings: {str(e)}")
     
     def reset_to_defaults(self):
-        """Reset all settings to defaults"""
-        reply = QMessageBox.question(
-            self, 
-            "Reset Settings", 
-            "Are you sure you want to reset all settings to defaults?\n\nThis action cannot be undone.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            if settings_manager.reset_to_defaults():
-                self.load_settings()  # Reload UI with defaults
-                QMessageBox.information(self, "Settings Reset", "All settings have been reset to defaults!")
-            else:
-                QMessageBox.critical(self, "Error", "Failed to reset settings to defaults!")
+        """Ask for confirmation before resetting all settings to defaults"""
+        self._confirm_bar.show()
+    
+    def _really_reset(self):
+        """Reset all settings to defaults once the user has confirmed"""
+        self._confirm_bar.hide()
+        if settings_manager.reset_to_defaults():
+            self._snapshot = None
+            self.load_settings()  # Reload UI with defaults
+            QMessageBox.information(self, "Settings Reset", "All settings have been reset to defaults!")
+        else:
+            QMessageBox.critical(self, "Error", "Failed to reset settings to defaults!")
 
 # Convenience function to show settings dialog
-def show_settings_dialog(parent=None):
+def show_settings_dialog(parent=None, snapshot=None):
     """Show the settings dialog"""
-    dialog = SettingsDialog(parent)
+    dialog = SettingsDialog(parent, snapshot)
     return dialog.exec()
\ No newline at end of file
@@ -1,9 +1,12 @@
 """
 Modern UI Styles and Themes for Heimdall
 """
+from types import MappingProxyType
 
-# Color Palette
-COLORS = {
+from PyQt6.QtGui import QFont
+
+# Color Palette (read-only views, the palettes never change at runtime)
+COLORS = MappingProxyType({
     # Primary Colors
     'primary': '#667eea',
     'primary_dark': '#5a6fd8',
@@ -32,10 +35,10 @@ COLORS = {
     'listening': '#3498db',
     'processing': '#f39c12',
     'speaking': '#2ecc71'
-}
+})
 
 # Light Theme
-LIGHT_THEME = {
+LIGHT_THEME = MappingProxyType({
     'background': COLORS['white'],
     'surface': COLORS['light_gray'],
     'text_primary': COLORS['black'],
@@ -43,10 +46,10 @@ LIGHT_THEME = {
     'border': 'rgba(0, 0, 0, 0.1)',
     'shadow': 'rgba(0, 0, 0, 0.1)',
     'accent': COLORS['primary']
-}
+})
 
 # Dark Theme
-DARK_THEME = {
+DARK_THEME = MappingProxyType({
     'background': '#1a1a1a',
     'surface': '#2d2d2d',
     'text_primary': '#ffffff',
@@ -54,49 +57,54 @@ DARK_THEME = {
     'border': 'rgba(255, 255, 255, 0.1)',
     'shadow': 'rgba(0, 0, 0, 0.3)',
     'accent': COLORS['primary_light']
-}
+})
 
-def get_main_window_style(dark_mode=False):
-    """Get main window stylesheet"""
-    theme = DARK_THEME if dark_mode else LIGHT_THEME
-    
-    return f"""
+# Brand colors used by the gradient styles, bound once
+_PRIMARY = COLORS['primary']
+_PRIMARY_DARK = COLORS['primary_dark']
+_SECONDARY = COLORS['secondary']
+_SECONDARY_DARK = COLORS['secondary_dark']
+
+# Stylesheet templates, filled in with str.format_map from _theme_values().
+# Literal braces are doubled.
+
+# Main window
+_MAIN_WINDOW_TMPL = """
     QMainWindow {{
-        background: {theme['background']};
-        color: {theme['text_primary']};
-        font-family: 'Segoe UI', 'San Francisco', 'Helvetica Neue', Arial, sans-serif;
+        background: {background};
+        color: {text_primary};
     }}
     
     QFrame {{
-        background: {theme['surface']};
+        background: {surface};
         border: none;
     }}
     
     QLabel {{
-        color: {theme['text_primary']};
+        color: {text_primary};
         background: transparent;
     }}
     
     QScrollArea {{
         border: none;
-        background: {theme['background']};
+        background: {background};
     }}
     
     QScrollBar:vertical {{
-        background: {theme['border']};
+        background: {border};
         width: 8px;
         border-radius: 4px;
         margin: 0;
     }}
     
     QScrollBar::handle:vertical {{
-        background: {theme['text_secondary']};
+        background: {text_secondary};
         border-radius: 4px;
         min-height: 20px;
     }}
     
     QScrollBar::handle:vertical:hover {{
-        background: {theme['text_primary']};
+        background: {text_primary};
     }}
     
     QScrollBar::add-line:vertical,
@@ -105,18 +113,15 @@ def get_main_window_style(dark_mode=False):
     }}
     """
 
-def get_sidebar_style(dark_mode=False):
-    """Get sidebar stylesheet"""
-    theme = DARK_THEME if dark_mode else LIGHT_THEME
-    
-    return f"""
+# Sidebar
+_SIDEBAR_TMPL = """
     QFrame#sidebar {{
-        background: {theme['surface']};
-        border-right: 1px solid {theme['border']};
+        background: {surface};
+        border-right: 1px solid {border};
     }}
     
     QLabel#title {{
-        color: {theme['accent']};
+        color: {accent};
         font-size: 24px;
         font-weight: bold;
         margin-bottom: 20px;
@@ -124,7 +129,7 @@ def get_sidebar_style(dark_mode=False):
     
     QPushButton#nav_button {{
         background: transparent;
-        color: {theme['text_secondary']};
+        color: {text_secondary};
         border: none;
         border-radius: 8px;
         font-size: 14px;
@@ -134,73 +139,60 @@ def get_sidebar_style(dark_mode=False):
     }}
     
     QPushButton#nav_button:hover {{
-        background: {theme['border']};
-        color: {theme['text_primary']};
+        background: {border};
+        color: {text_primary};
     }}
     
     QPushButton#nav_button:checked {{
-        background: rgba({theme['accent'].replace('#', '')}, 0.1);
-        color: {theme['accent']};
+        background: rgba({accent_hex}, 0.1);
+        color: {accent};
         font-weight: 500;
     }}
     """
 
-def get_chat_style(dark_mode=False):
-    """Get chat area stylesheet"""
-    theme = DARK_THEME if dark_mode else LIGHT_THEME
-    
-    return f"""
+# Chat area
+_CHAT_TMPL = """
     QFrame#chat_message_user {{
-        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-            stop:0 {COLORS['primary']}, stop:1 {COLORS['secondary']});
-        border-radius: 15px;
         color: white;
         padding: 10px 15px;
         margin: 5px 50px 5px 0;
     }}
     
     QFrame#chat_message_ai {{
-        background: {theme['surface']};
-        border: 1px solid {theme['border']};
+        background: {surface};
+        border: 1px solid {border};
         border-radius: 15px;
-        color: {theme['text_primary']};
+        color: {text_primary};
         padding: 10px 15px;
         margin: 5px 0 5px 50px;
     }}
     
     QLabel#avatar {{
-        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-            stop:0 {COLORS['primary']}, stop:1 {COLORS['secondary']});
-        border-radius: 20px;
         color: white;
         font-weight: bold;
         font-size: 16px;
     }}
     
     QLineEdit#message_input {{
-        border: 2px solid {theme['border']};
+        border: 2px solid {border};
         border-radius: 25px;
         padding: 0 20px;
         font-size: 14px;
-        background: {theme['surface']};
-        color: {theme['text_primary']};
+        background: {surface};
+        color: {text_primary};
     }}
     
     QLineEdit#message_input:focus {{
-        border: 2px solid {theme['accent']};
-        background: {theme['background']};
+        border: 2px solid {accent};
+        background: {background};
     }}
     """
 
-def get_button_style(primary=False, dark_mode=False):
-    """Get button stylesheet"""
-    theme = DARK_THEME if dark_mode else LIGHT_THEME
-    
-    if primary:
-        return f"""
+# Primary button
+_BUTTON_PRIMARY_TMPL = """
         QPushButton {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 {COLORS['primary']}, stop:1 {COLORS['secondary']});
+                stop:0 {primary}, stop:1 {secondary});
             color: white;
             border: none;
             border-radius: 20px;
@@ -210,39 +202,35 @@ def get_button_style(primary=False, dark_mode=False):
         }}
         QPushButton:hover {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 {COLORS['primary_dark']}, stop:1 {COLORS['secondary_dark']});
+                stop:0 {primary_dark}, stop:1 {secondary_dark});
         }}
         QPushButton:pressed {{
             background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 {COLORS['primary_dark']}, stop:1 {COLORS['secondary_dark']});
-            transform: translateY(1px);
+                stop:0 {primary_dark}, stop:1 {secondary_dark});
         }}
         """
-    else:
-        return f"""
+
+# Secondary button
+_BUTTON_TMPL = """
         QPushButton {{
-            background: {theme['surface']};
-            color: {theme['text_primary']};
-            border: 1px solid {theme['border']};
+            background: {surface};
+            color: {text_primary};
+            border: 1px solid {border};
             border-radius: 20px;
             font-size: 14px;
             padding: 0 20px;
         }}
         QPushButton:hover {{
-            background: {theme['border']};
-            border: 1px solid {theme['text_secondary']};
+            background: {border};
+            border: 1px solid {text_secondary};
         }}
         QPushButton:pressed {{
-            background: {theme['text_secondary']};
-            transform: translateY(1px);
+            background: {text_secondary};
         }}
         """
 
-def get_status_indicator_style(status, dark_mode=False):
-    """Get status indicator stylesheet"""
-    color = COLORS.get(status, COLORS['idle'])
-    
-    return f"""
+# Status indicator
+_STATUS_TMPL = """
     QLabel {{
         background: {color};
         border-radius: 6px;
@@ -250,61 +238,115 @@ def get_status_indicator_style(status, dark_mode=False):
     }}
     """
 
-def get_header_style(dark_mode=False):
-    """Get header stylesheet"""
-    theme = DARK_THEME if dark_mode else LIGHT_THEME
-    
-    return f"""
+# Header
+_HEADER_TMPL = """
     QFrame#header {{
-        background: {theme['background']};
-        border-bottom: 1px solid {theme['border']};
+        background: {background};
+        border-bottom: 1px solid {border};
         padding: 0 30px;
     }}
     
     QLabel#header_title {{
-        color: {theme['text_primary']};
+        color: {text_primary};
         font-size: 18px;
         font-weight: bold;
     }}
     """
 
-# Animation Styles
-ANIMATIONS = {
-    'fade_in': """
-        QWidget {
-            animation: fadeIn 0.3s ease-in-out;
-        }
-        
-        @keyframes fadeIn {
-            from { opacity: 0; }
-            to { opacity: 1; }
-        }
-    """,
-    
-    'slide_in': """
-        QWidget {
-            animation: slideIn 0.3s ease-out;
-        }
-        
-        @keyframes slideIn {
-            from { transform: translateX(-20px); opacity: 0; }
-            to { transform: translateX(0); opacity: 1; }
-        }
-    """,
-    
-    'pulse': """
-        QWidget {
-            animation: pulse 2s infinite;
-        }
-        
-        @keyframes pulse {
-            0% { transform: scale(1); }
-            50% { transform: scale(1.05); }
-            100% { transform: scale(1); }
-        }
-    """
+
+def _theme_values(dark_mode):
+    """Placeholder values for the templates: the theme palette plus brand colors"""
+    theme = DARK_THEME if dark_mode else LIGHT_THEME
+    return {
+        **theme,
+        'accent_hex': theme['accent'].replace('#', ''),
+        'primary': _PRIMARY,
+        'primary_dark': _PRIMARY_DARK,
+        'secondary': _SECONDARY,
+        'secondary_dark': _SECONDARY_DARK,
+    }
+
+def _build_main_window_style(dark_mode=False):
+    """Get main window stylesheet"""
+    return _MAIN_WINDOW_TMPL.format_map(_theme_values(dark_mode))
+
+def _build_sidebar_style(dark_mode=False):
+    """Get sidebar stylesheet"""
+    return _SIDEBAR_TMPL.format_map(_theme_values(dark_mode))
+
+def _build_chat_style(dark_mode=False):
+    """Get chat area stylesheet"""
+    return _CHAT_TMPL.format_map(_theme_values(dark_mode))
+
+def _build_button_style(primary=False, dark_mode=False):
+    """Get button stylesheet"""
+    template = _BUTTON_PRIMARY_TMPL if primary else _BUTTON_TMPL
+    return template.format_map(_theme_values(dark_mode))
+
+def _build_status_indicator_style(status, dark_mode=False):
+    """Get status indicator stylesheet"""
+    return _STATUS_TMPL.format_map({'color': COLORS.get(status, COLORS['idle'])})
+
+def _build_header_style(dark_mode=False):
+    """Get header stylesheet"""
+    return _HEADER_TMPL.format_map(_theme_values(dark_mode))
+
+# Prebuilt stylesheets - the palettes are static, so every variant is
+# formatted once at import and the getters below only do a dict lookup
+_CACHED_STYLES = {
+    theme_name: {
+        'main_window': _build_main_window_style(dark_mode),
+        'sidebar': _build_sidebar_style(dark_mode),
+        'chat': _build_chat_style(dark_mode),
+        'header': _build_header_style(dark_mode),
+        'button': _build_button_style(False, dark_mode),
+        'button_primary': _build_button_style(True, dark_mode),
+    }
+    for theme_name, dark_mode in (('light', False), ('dark', True))
 }
 
+# One stylesheet per status color; unknown statuses fall back to idle
+_STATUS_STYLES = {status: _build_status_indicator_style(status) for status in COLORS}
+
+
+_UI_FONT = None
+
+
+def ui_font():
+    """Base font for top-level windows, built once and inherited by their children"""
+    global _UI_FONT
+    if _UI_FONT is None:
+        _UI_FONT = QFont('Segoe UI', 10)
+        _UI_FONT.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
+    return _UI_FONT
+
+def _theme_styles(dark_mode):
+    return _CACHED_STYLES['dark' if dark_mode else 'light']
+
+def get_main_window_style(dark_mode=False):
+    """Get main window stylesheet"""
+    return _theme_styles(dark_mode)['main_window']
+
+def get_sidebar_style(dark_mode=False):
+    """Get sidebar stylesheet"""
+    return _theme_styles(dark_mode)['sidebar']
+
+def get_chat_style(dark_mode=False):
+    """Get chat area stylesheet"""
+    return _theme_styles(dark_mode)['chat']
+
+def get_button_style(primary=False, dark_mode=False):
+    """Get button stylesheet"""
+    return _theme_styles(dark_mode)['button_primary' if primary else 'button']
+
+def get_status_indicator_style(status, dark_mode=False):
+    """Get status indicator stylesheet"""
+    return _STATUS_STYLES.get(status, _STATUS_STYLES['idle'])
+
+def get_header_style(dark_mode=False):
+    """Get header stylesheet"""
+    return _theme_styles(dark_mode)['header']
+
 # Responsive Breakpoints
 BREAKPOINTS = {
     'mobile': 480,
@@ -3,29 +3,56 @@ Tkinter-based GUI for Heimdall (Maximum Compatibility)
 Uses built-in Python GUI framework for universal compatibility
 """
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
-import threading
+from tkinter import ttk, scrolledtext
 import asyncio
+import importlib
+import re
+import time
 from datetime import datetime
 import sys
-import os
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-try:
-    from core.voice_handler import VoiceHandler
-    from core.voice_output import VoiceOutput
-    from core.intent_parser import IntentParser
-    from core.screenshot_capturer import ScreenshotCapturer
-    from core.screen_analyzer import ScreenAnalyzer
-    from core.screen_controller import ScreenController
-    from storage.database import LocalDatabase
-    from utils.config import get_config
-except ImportError as e:
-    print(f"Import error: {e}")
-    print("Running in demo mode without AI functionality")
+# AI modules pull in whisper/torch/pyaudio, so they are imported in the
+# background after the window is up (see setup_ai_components)
+AI_MODULES = {
+    "VoiceHandler": "core.voice_handler",
+    "VoiceOutput": "core.voice_output",
+    "IntentParser": "core.intent_parser",
+    "ScreenshotCapturer": "core.screenshot_capturer",
+    "ScreenAnalyzer": "core.screen_analyzer",
+    "ScreenController": "core.screen_controller",
+    "LocalDatabase": "storage.database",
+    "get_config": "utils.config",
+}
+
+
+WELCOME_TEXT = ("Hello! I'm Heimdall, your AI assistant. I can help you navigate your screen, "
+                "control applications, and answer questions. Try typing a command or click the voice button!")
+
+# Demo mode keyword sets and canned replies
+_WORD_RE = re.compile(r"[a-z']+")
+_GREETINGS = frozenset({"hello", "hi", "hey"})
+_CONTROL = frozenset({"click", "scroll", "type"})
+
+DEMO_GREETING = "Hello! I'm running in demo mode. Install the AI components to unlock full functionality."
+DEMO_HELP = ("I can help you with:\n"
+             "• Screen reading and analysis\n"
+             "• Clicking and navigation\n"
+             "• Voice commands\n"
+             "• Text input automation\n\n"
+             "Install the full AI components for complete functionality!")
+DEMO_CONTROL = "I understand you want to control the screen. Please install the AI components for full functionality."
+DEMO_READ = "I can read screen content when the AI components are installed."
+DEMO_DEFAULT = "I'm running in demo mode. Install the AI components to process your commands!"
+
+
+def import_ai_modules():
+    """Import the AI components, returning a name -> object mapping"""
+    return {name: getattr(importlib.import_module(module), name)
+            for name, module in AI_MODULES.items()}
 
 
 class ModernStyle:
@@ -42,10 +69,15 @@ class ModernStyle:
     WARNING = "#ffc107"
     ERROR = "#dc3545"
     
-    @staticmethod
-    def configure_style():
-        """Configure ttk styles"""
+    _style = None  # ttk.Style already configured, see configure_style
+    
+    @classmethod
+    def configure_style(cls):
+        """Configure ttk styles (once per Tk interpreter)"""
         style = ttk.Style()
+        if cls._style is not None and cls._style.tk is style.tk:
+            return cls._style
+        cls._style = style
         
         # Configure button styles
         style.configure(
@@ -73,62 +105,156 @@ class ModernStyle:
         return style
 
 
+# Text tags for the chat display, as the tuples Text.insert expects
+TIMESTAMP_TAG = ("timestamp",)
+USER_TAG = ("user_message",)
+AI_TAG = ("ai_message",)
+
+
 class ChatMessage:
     """Represents a chat message"""
     
-    def __init__(self, text, is_user=True, timestamp=None):
+    def __init__(self, text, is_user=True, timestamp=None, timestamp_str=None, header=None):
         self.text = text
         self.is_user = is_user
-        self.timestamp = timestamp or datetime.now()
+        
+        # Callers that already have the "HH:MM" string skip the clock entirely
+        if timestamp_str is None:
+            timestamp = timestamp or datetime.now()
+            timestamp_str = timestamp.strftime("%H:%M")
+        self.timestamp = timestamp
+        self.timestamp_str = timestamp_str
+        
+        # Formatted once and reused whenever the message is re-rendered
+        if header is None:
+            sender = "You" if is_user else "Heimdall"
+            header = f"\n{sender} ({timestamp_str}):\n"
+        self.header = header
+        self.body = text + "\n"
+        self.tag = USER_TAG if is_user else AI_TAG
+
+
+class TextPeer(tk.Text):
+    """Text widget created as a Tk peer of another Text widget
+    
+    Peers share one text store, tags included, so extra views of the
+    transcript (previews, logs, debug panes) cost no copying and need no
+    mirrored inserts - use this rather than filling a new Text widget.
+    """
+    
+    def __init__(self, master, source, **kw):
+        # Register the Python wrapper as tk.Text would, but let Tk build the
+        # widget with "peer create" instead of as a new, empty text
+        self._setup(master, {})
+        self.widgetName = "text"
+        source.peer_create(self._w, kw)
 
 
 class StatusIndicator:
     """Simple status indicator"""
     
+    # Display text and color for each status
+    _TABLE = {
+        "idle": ("● Ready", ModernStyle.SUCCESS),
+        "listening": ("● Listening...", ModernStyle.PRIMARY),
+        "processing": ("● Processing...", ModernStyle.WARNING),
+        "speaking": ("● Speaking...", ModernStyle.SUCCESS),
+        "error": ("● Error", ModernStyle.ERROR)
+    }
+    
     def __init__(self, parent):
         self.frame = ttk.Frame(parent)
         self.status_var = tk.StringVar(value="● Ready")
+        self._last_color = ModernStyle.SUCCESS
         self.status_label = ttk.Label(
             self.frame, 
             textvariable=self.status_var,
-            foreground=ModernStyle.SUCCESS
+            foreground=self._last_color
         )
         self.status_label.pack()
     
     def update_status(self, status):
         """Update status display"""
-        status_colors = {
-            "idle": ModernStyle.SUCCESS,
-            "listening": ModernStyle.PRIMARY,
-            "processing": ModernStyle.WARNING,
-            "speaking": ModernStyle.SUCCESS,
-            "error": ModernStyle.ERROR
-        }
-        
-        status_text = {
-            "idle": "● Ready",
-            "listening": "● Listening...",
-            "processing": "● Processing...",
-            "speaking": "● Speaking...",
-            "error": "● Error"
-        }
-        
-        self.status_var.set(status_text.get(status, "● Ready"))
-        self.status_label.configure(foreground=status_colors.get(status, ModernStyle.SUCCESS))
+        text, color = self._TABLE.get(status, self._TABLE["idle"])
+        self.status_var.set(text)
+        
+        # Only restyle the label when the color actually changes
+        if color != self._last_color:
+            self._last_color = color
+            self.status_label.configure(foreground=color)
 
 
 class HeimdallTkinterGUI:
     """Main Tkinter GUI application"""
     
+    # The chat Text widget only holds the newest messages; self.messages is the
+    # full history and older pages are re-inserted when scrolled back to
+    VISIBLE_WINDOW = 200
+    HISTORY_PAGE = 50
+    
+    # asyncio runs on the Tk thread: pumped every few ms while tasks are
+    # pending, and rarely when there is nothing to do
+    ASYNC_POLL_MS = 5
+    ASYNC_IDLE_MS = 50
+    
+    # Chat timestamps only show minutes, so the string is reformatted once a minute
+    _last_minute = -1
+    _last_timestamp_str = ""
+    _user_prefix = ""
+    _ai_prefix = ""
+    
     def __init__(self):
         self.root = tk.Tk()
         self.messages = []
+        self._first_rendered = 0  # index in self.messages of the top rendered message
+        self._loading_history = False
+        self._pending_writes = []  # message indices waiting for _flush_writes
+        
+        self._loop = asyncio.new_event_loop()
+        self._pump_id = None
+        
+        # One long-lived worker handles messages in order from this queue
+        self._work_q = asyncio.Queue()
+        self._processing = False
+        self._worker = self._loop.create_task(self._worker_loop())
         self.ai_components = None
-        self.ai_thread = None
+        self.ai_modules = None
+        self._ai_ready = False
         
         self.setup_window()
         self.create_widgets()
         self.setup_ai_components()
+        self._schedule_pump(self.ASYNC_IDLE_MS)
+    
+    def _schedule_pump(self, delay_ms):
+        """(Re)arm the Tk timer that runs the asyncio loop"""
+        if self._pump_id is not None:
+            self.root.after_cancel(self._pump_id)
+        self._pump_id = self.root.after(delay_ms, self._pump_asyncio)
+    
+    def _pump_asyncio(self):
+        """Run the asyncio callbacks that are ready, then schedule the next pump"""
+        self._pump_id = None
+        self._loop.call_soon(self._loop.stop)
+        self._loop.run_forever()
+        
+        # The idle worker is always pending, so only count it while it has work
+        busy = (self._processing or not self._work_q.empty()
+                or len(asyncio.all_tasks(self._loop)) > 1)
+        self._schedule_pump(self.ASYNC_POLL_MS if busy else self.ASYNC_IDLE_MS)
+    
+    async def _worker_loop(self):
+        """Process queued messages one at a time; a None item stops the worker"""
+        while True:
+            text = await self._work_q.get()
+            try:
+                if text is None:
+                    return
+                self._processing = True
+                await self.process_with_ai(text)
+            finally:
+                self._processing = False
+                self._work_q.task_done()
     
     def setup_window(self):
         """Setup main window"""
@@ -213,6 +339,7 @@ class HeimdallTkinterGUI:
             pady=20
         )
         self.chat_display.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.chat_display.configure(yscrollcommand=self._on_chat_scroll)
         
         # Configure text tags for styling
         self.chat_display.tag_configure(
@@ -241,12 +368,8 @@ class HeimdallTkinterGUI:
             font=("Segoe UI", 9)
         )
         
-        # Add welcome message
-        self.add_message(
-            "Hello! I'm Heimdall, your AI assistant. I can help you navigate your screen, "
-            "control applications, and answer questions. Try typing a command or click the voice button!",
-            is_user=False
-        )
+        # Add welcome message once the window is up
+        self.root.after_idle(self.add_message, WELCOME_TEXT, False)
     
     def create_input_area(self, parent):
         """Create message input area"""
@@ -297,24 +420,75 @@ class HeimdallTkinterGUI:
     
     def add_message(self, text, is_user=True):
         """Add a message to the chat display"""
-        message = ChatMessage(text, is_user)
+        stamp = self._timestamp_str()
+        header = self._user_prefix if is_user else self._ai_prefix
+        message = ChatMessage(text, is_user, timestamp_str=stamp, header=header)
         self.messages.append(message)
         
-        # Format timestamp
-        timestamp = message.timestamp.strftime("%H:%M")
-        
-        # Insert message
+        # Rendering is deferred so a burst of messages costs one Text update
+        if not self._pending_writes:
+            self.root.after_idle(self._flush_writes)
+        self._pending_writes.append(len(self.messages) - 1)
+    
+    def _timestamp_str(self):
+        """Current time as "HH:MM"; it and the message headers change once a minute"""
+        now = time.time()
+        minute = int(now // 60)
+        if minute != self._last_minute:
+            self._last_minute = minute
+            stamp = self._last_timestamp_str = time.strftime("%H:%M", time.localtime(now))
+            self._user_prefix = f"\nYou ({stamp}):\n"
+            self._ai_prefix = f"\nHeimdall ({stamp}):\n"
+        return self._last_timestamp_str
+    
+    def _flush_writes(self):
+        """Insert all queued messages, trim the window and scroll once"""
         self.chat_display.configure(state=tk.NORMAL)
+        for index in self._pending_writes:
+            self._render_message(index, tk.END)
+        self._pending_writes.clear()
+        self._trim_history()
+        self.chat_display.configure(state=tk.DISABLED)
+        self.chat_display.see(tk.END)
+    
+    def _render_message(self, index, position):
+        """Insert self.messages[index] at position ("1.0" or END) and mark its start"""
+        message = self.messages[index]
+        start = self.chat_display.index("1.0" if position == "1.0" else "end-1c")
+        self.chat_display.insert(position, message.header, TIMESTAMP_TAG, message.body, message.tag)
+        self.chat_display.mark_set(f"msg{index}", start)
+    
+    def _trim_history(self):
+        """Delete rendered messages older than the visible window"""
+        first = len(self.messages) - self.VISIBLE_WINDOW
+        if first <= self._first_rendered:
+            return
         
-        if is_user:
-            self.chat_display.insert(tk.END, f"\nYou ({timestamp}):\n", "timestamp")
-            self.chat_display.insert(tk.END, f"{text}\n", "user_message")
-        else:
-            self.chat_display.insert(tk.END, f"\nHeimdall ({timestamp}):\n", "timestamp")
-            self.chat_display.insert(tk.END, f"{text}\n", "ai_message")
+        self.chat_display.delete("1.0", f"msg{first}")
+        for index in range(self._first_rendered, first):
+            self.chat_display.mark_unset(f"msg{index}")
+        self._first_rendered = first
+    
+    def _on_chat_scroll(self, first, last):
+        """Scrollbar callback; pulls older messages back in at the top"""
+        self.chat_display.vbar.set(first, last)
+        if float(first) <= 0.0 and self._first_rendered > 0 and not self._loading_history:
+            self._loading_history = True
+            self.root.after_idle(self._load_older)
+    
+    def _load_older(self):
+        """Re-insert the page of messages just above the rendered ones"""
+        previous_top = f"msg{self._first_rendered}"
+        start = max(0, self._first_rendered - self.HISTORY_PAGE)
         
+        self.chat_display.configure(state=tk.NORMAL)
+        for index in range(self._first_rendered - 1, start - 1, -1):
+            self._render_message(index, "1.0")
         self.chat_display.configure(state=tk.DISABLED)
-        self.chat_display.see(tk.END)
+        
+        self._first_rendered = start
+        self.chat_display.yview(previous_top)  # keep the reader's place
+        self._loading_history = False
     
     def send_message(self):
         """Send a message"""
@@ -333,54 +507,44 @@ class HeimdallTkinterGUI:
         """Process user message"""
         self.status_indicator.update_status("processing")
         
-        # Simple responses for demo mode
-        if not self.ai_components:
+        # Simple responses for demo mode (also while the AI modules still load)
+        if not self._ai_ready or not self.ai_components:
             self.handle_demo_response(text)
             return
         
-        # Process with AI in background thread
-        threading.Thread(
-            target=self.process_with_ai,
-            args=(text,),
-            daemon=True
-        ).start()
+        # Hand the message to the AI worker, starting on the next Tk pass
+        self._work_q.put_nowait(text)
+        self._schedule_pump(0)
     
     def handle_demo_response(self, text):
         """Handle responses in demo mode"""
-        text_lower = text.lower()
-        
-        if any(word in text_lower for word in ["hello", "hi", "hey"]):
-            response = "Hello! I'm running in demo mode. Install the AI components to unlock full functionality."
-        elif "help" in text_lower:
-            response = ("I can help you with:\n"
-                       "• Screen reading and analysis\n"
-                       "• Clicking and navigation\n"
-                       "• Voice commands\n"
-                       "• Text input automation\n\n"
-                       "Install the full AI components for complete functionality!")
-        elif any(word in text_lower for word in ["click", "scroll", "type"]):
-            response = "I understand you want to control the screen. Please install the AI components for full functionality."
-        elif "read" in text_lower:
-            response = "I can read screen content when the AI components are installed."
+        tokens = set(_WORD_RE.findall(text.lower()))
+        
+        if tokens & _GREETINGS:
+            response = DEMO_GREETING
+        elif "help" in tokens:
+            response = DEMO_HELP
+        elif tokens & _CONTROL:
+            response = DEMO_CONTROL
+        elif "read" in tokens:
+            response = DEMO_READ
         else:
-            response = "I'm running in demo mode. Install the AI components to process your commands!"
+            response = DEMO_DEFAULT
         
-        # Simulate processing delay
-        self.root.after(1000, lambda: self.add_ai_response(response))
+        self.root.after_idle(self.add_ai_response, response)
     
-    def process_with_ai(self, text):
+    async def process_with_ai(self, text):
         """Process message with AI components"""
         try:
             # This would contain the actual AI processing
             # For now, just a placeholder
             response = "AI processing is not yet implemented in this version."
             
-            # Update UI in main thread
-            self.root.after(0, lambda: self.add_ai_response(response))
-            
         except Exception as e:
-            error_msg = f"Error processing message: {str(e)}"
-            self.root.after(0, lambda: self.add_ai_response(error_msg))
+            response = f"Error processing message: {str(e)}"
+        
+        # Already on the Tk thread; update once the current event is handled
+        self.root.after_idle(self.add_ai_response, response)
     
     def add_ai_response(self, response):
         """Add AI response to chat"""
@@ -391,10 +555,10 @@ class HeimdallTkinterGUI:
         """Toggle voice input"""
         self.status_indicator.update_status("listening")
         
-        # Simulate voice input
-        self.root.after(2000, lambda: self.add_ai_response(
+        self.root.after_idle(
+            self.add_ai_response,
             "Voice input is not yet implemented. Please type your message instead."
-        ))
+        )
     
     def show_settings(self):
         """Show settings dialog"""
@@ -416,6 +580,19 @@ class HeimdallTkinterGUI:
             foreground=ModernStyle.TEXT_SECONDARY
         ).pack(pady=10)
         
+        # Transcript preview shares the chat display's contents
+        preview = TextPeer(
+            settings_window,
+            self.chat_display,
+            height=6,
+            wrap=tk.WORD,
+            borderwidth=0,
+            highlightthickness=0,
+            state=tk.DISABLED
+        )
+        preview.pack(fill=tk.BOTH, expand=True, padx=20)
+        preview.see(tk.END)
+        
         ttk.Button(
             settings_window,
             text="Close",
@@ -423,15 +600,24 @@ class HeimdallTkinterGUI:
         ).pack(pady=20)
     
     def setup_ai_components(self):
-        """Setup AI components if available"""
+        """Start loading the AI components without blocking the window"""
+        self._loop.create_task(self._load_ai_components())
+    
+    async def _load_ai_components(self):
+        """Import the AI modules on a worker thread, then mark the AI as ready"""
         try:
-            # Try to initialize AI components
-            # This is a placeholder for now
-            self.ai_components = None
-            print("AI components not yet integrated with Tkinter GUI")
+            self.ai_modules = await self._loop.run_in_executor(None, import_ai_modules)
+        except ImportError as e:
+            print(f"Import error: {e}")
+            print("Running in demo mode without AI functionality")
+            return
         except Exception as e:
             print(f"Could not initialize AI components: {e}")
-            self.ai_components = None
+            return
+        
+        # This is a placeholder for now
+        self._ai_ready = True
+        print("AI components not yet integrated with Tkinter GUI")
     
     def run(self):
         """Run the GUI application"""
@@ -440,9 +626,15 @@ class HeimdallTkinterGUI:
         except KeyboardInterrupt:
             print("Application interrupted")
         finally:
-            if self.ai_thread:
-                # Clean up AI thread
-                pass
+            # Stop the worker, cancel anything else and let the loop unwind
+            self._work_q.put_nowait(None)
+            tasks = asyncio.all_tasks(self._loop) - {self._worker}
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(
+                asyncio.gather(self._worker, *tasks, return_exceptions=True)
+            )
+            self._loop.close()
 
 
 def main():
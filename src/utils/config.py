@@ -4,110 +4,194 @@ Loads environment variables and provides typed configuration access.
 """
 
 import os
+import socket
+from functools import cached_property, lru_cache
 from typing import Optional
 from pathlib import Path
-from dotenv import load_dotenv
+from urllib.parse import urlparse
+from dotenv import dotenv_values
 from pydantic import BaseSettings, Field
 
 
 # Load environment variables from .env file
 env_path = Path(__file__).parent.parent.parent / '.env'
-load_dotenv(env_path)
 
 
+def load_env_file() -> bool:
+    """
+    Load .env into os.environ if it changed since the last load.
+
+    Variables set outside .env always win; ones that came from an earlier
+    load are updated, and cached settings sections are rebuilt.
+    """
+    global _dotenv_mtime
+    mtime = env_path.stat().st_mtime if env_path.exists() else 0
+    if mtime == _dotenv_mtime:
+        return False
+
+    values = dotenv_values(env_path) if env_path.exists() else {}
+    for key, value in values.items():
+        if value is not None and (key not in os.environ or key in _dotenv_keys):
+            os.environ[key] = value
+            _dotenv_keys.add(key)
+
+    if _dotenv_mtime is not None:
+        settings_section.cache_clear()
+    _dotenv_mtime = mtime
+    return True
+
+
+_dotenv_mtime = None
+_dotenv_keys = set()  # keys this module put into os.environ
+load_env_file()
+
+
+# Fields are read from the environment variable of the same name (upper-cased,
+# after any Config.env_prefix), so most need no explicit Field(env=...)
 class LocalAIConfig(BaseSettings):
     """Local AI configuration (Ollama + Whisper)."""
-    ollama_host: str = Field('http://localhost:11434', env='OLLAMA_HOST')
-    ollama_model: str = Field('llama3.2:3b', env='OLLAMA_MODEL')
-    whisper_model: str = Field('base', env='WHISPER_MODEL')
+    ollama_host: str = 'http://localhost:11434'
+    ollama_model: str = 'llama3.2:3b'
+    whisper_model: str = 'base'
 
 
 class LocalTTSConfig(BaseSettings):
     """Local TTS configuration (pyttsx3)."""
-    engine: str = Field('pyttsx3', env='TTS_ENGINE')
-    voice_index: int = Field(0, env='TTS_VOICE_INDEX')
-    rate: int = Field(200, env='TTS_RATE')
-    volume: float = Field(0.9, env='TTS_VOLUME')
+    engine: str = 'pyttsx3'
+    voice_index: int = 0
+    rate: int = 200
+    volume: float = 0.9
+    
+    class Config:
+        env_prefix = 'TTS_'
 
 
 class LocalStorageConfig(BaseSettings):
     """Local storage configuration (SQLite + filesystem)."""
-    database_path: str = Field('./data/heimdall.db', env='DATABASE_PATH')
-    screenshots_path: str = Field('./data/screenshots', env='SCREENSHOTS_PATH')
-    logs_path: str = Field('./data/logs', env='LOGS_PATH')
+    database_path: str = './data/heimdall.db'
+    screenshots_path: str = './data/screenshots'
+    logs_path: str = './data/logs'
 
 
 class AudioConfig(BaseSettings):
     """Audio processing configuration."""
-    sample_rate: int = Field(16000, env='AUDIO_SAMPLE_RATE')
-    chunk_size: int = Field(1024, env='AUDIO_CHUNK_SIZE')
+    sample_rate: int = 16000
+    chunk_size: int = 1024
     microphone_device_index: int = Field(0, env='MICROPHONE_DEVICE_INDEX')
+    
+    class Config:
+        env_prefix = 'AUDIO_'
 
 
 class ScreenAnalysisConfig(BaseSettings):
     """Screen analysis configuration."""
-    ocr_confidence_threshold: float = Field(0.7, env='OCR_CONFIDENCE_THRESHOLD')
-    ui_detection_confidence: float = Field(0.8, env='UI_DETECTION_CONFIDENCE')
-    screenshot_quality: int = Field(95, env='SCREENSHOT_QUALITY')
+    ocr_confidence_threshold: float = 0.7
+    ui_detection_confidence: float = 0.8
+    screenshot_quality: int = 95
 
 
 class PerformanceConfig(BaseSettings):
     """Performance and rate limiting configuration."""
-    max_concurrent_requests: int = Field(5, env='MAX_CONCURRENT_REQUESTS')
-    api_timeout_seconds: int = Field(30, env='API_TIMEOUT_SECONDS')
-    cache_ttl_seconds: int = Field(300, env='CACHE_TTL_SECONDS')
+    max_concurrent_requests: int = 5
+    api_timeout_seconds: int = 30
+    cache_ttl_seconds: int = 300
 
 
 class PrivacyConfig(BaseSettings):
     """Privacy and security configuration."""
-    encrypt_screenshots: bool = Field(True, env='ENCRYPT_SCREENSHOTS')
-    local_processing_only: bool = Field(False, env='LOCAL_PROCESSING_ONLY')
-    anonymize_logs: bool = Field(True, env='ANONYMIZE_LOGS')
+    encrypt_screenshots: bool = True
+    local_processing_only: bool = False
+    anonymize_logs: bool = True
 
 
 class AppConfig(BaseSettings):
     """Main application configuration."""
-    screenshot_interval: int = Field(30, env='SCREENSHOT_INTERVAL')
-    log_level: str = Field('INFO', env='LOG_LEVEL')
-    debug_mode: bool = Field(False, env='DEBUG_MODE')
-    enable_telemetry: bool = Field(False, env='ENABLE_TELEMETRY')
-    mock_apis: bool = Field(False, env='MOCK_APIS')
-    test_mode: bool = Field(False, env='TEST_MODE')
+    screenshot_interval: int = 30
+    log_level: str = 'INFO'
+    debug_mode: bool = False
+    enable_telemetry: bool = False
+    mock_apis: bool = False
+    test_mode: bool = False
+
+
+@lru_cache(maxsize=None)
+def settings_section(section_cls):
+    """Shared instance of a settings section, parsed from the environment once.
+    
+    Call settings_section.cache_clear() after changing environment variables.
+    """
+    return section_cls()
 
 
 class HeimdallConfig:
-    """Central configuration manager for Heimdall - Free API Version."""
-    
-    def __init__(self):
-        self.local_ai = LocalAIConfig()
-        self.local_tts = LocalTTSConfig()
-        self.local_storage = LocalStorageConfig()
-        self.audio = AudioConfig()
-        self.screen_analysis = ScreenAnalysisConfig()
-        self.performance = PerformanceConfig()
-        self.privacy = PrivacyConfig()
-        self.app = AppConfig()
-    
-    def validate_setup(self) -> list[str]:
-        """Validate that local services are accessible."""
+    """Central configuration manager for Heimdall - Free API Version.
+    
+    Each section is parsed from the environment the first time it is accessed
+    and shared between instances through settings_section().
+    """
+    
+    @cached_property
+    def local_ai(self) -> LocalAIConfig:
+        return settings_section(LocalAIConfig)
+    
+    @cached_property
+    def local_tts(self) -> LocalTTSConfig:
+        return settings_section(LocalTTSConfig)
+    
+    @cached_property
+    def local_storage(self) -> LocalStorageConfig:
+        return settings_section(LocalStorageConfig)
+    
+    @cached_property
+    def audio(self) -> AudioConfig:
+        return settings_section(AudioConfig)
+    
+    @cached_property
+    def screen_analysis(self) -> ScreenAnalysisConfig:
+        return settings_section(ScreenAnalysisConfig)
+    
+    @cached_property
+    def performance(self) -> PerformanceConfig:
+        return settings_section(PerformanceConfig)
+    
+    @cached_property
+    def privacy(self) -> PrivacyConfig:
+        return settings_section(PrivacyConfig)
+    
+    @cached_property
+    def app(self) -> AppConfig:
+        return settings_section(AppConfig)
+    
+    def validate_setup(self, verify_api: bool = False) -> list[str]:
+        """Validate that local services are accessible.
+        
+        Ollama is probed with a plain TCP connect; pass verify_api=True to also
+        request /api/tags over HTTP.
+        """
         issues = []
         
-        # Check if Ollama is accessible
+        # Check if something is listening on the Ollama port
+        host = urlparse(self.local_ai.ollama_host)
         try:
-            import requests
-            response = requests.get(f"{self.local_ai.ollama_host}/api/tags", timeout=5)
-            if response.status_code != 200:
-                issues.append("Ollama server not accessible - run 'ollama serve'")
-        except Exception:
+            socket.create_connection((host.hostname or 'localhost', host.port or 11434), timeout=0.2).close()
+        except OSError:
             issues.append("Ollama not installed or not running - visit https://ollama.ai/")
-        
-        # Check if required directories exist
-        for path in [self.local_storage.screenshots_path, self.local_storage.logs_path]:
-            if not os.path.exists(path):
+        else:
+            if verify_api:
                 try:
-                    os.makedirs(path, exist_ok=True)
+                    import requests
+                    response = requests.get(f"{self.local_ai.ollama_host}/api/tags", timeout=5)
+                    if response.status_code != 200:
+                        issues.append("Ollama server not accessible - run 'ollama serve'")
                 except Exception:
-                    issues.append(f"Cannot create directory: {path}")
+                    issues.append("Ollama server not accessible - run 'ollama serve'")
+        
+        # Check if required directories exist
+        for path in (self.local_storage.screenshots_path, self.local_storage.logs_path):
+            try:
+                Path(path).mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                issues.append(f"Cannot create directory: {path} ({e})")
         
         return issues
     
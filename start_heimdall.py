@@ -5,11 +5,27 @@ Handles setup and graceful fallbacks
 """
 import sys
 import os
+import json
+import socket
 import subprocess
+import threading
+import urllib.request
 from pathlib import Path
 
-def check_ollama():
-    """Check if Ollama is running"""
+OLLAMA_ADDRESS = ("localhost", 11434)
+MODEL_NAME = "llama3.2:3b"
+PROMPT_TIMEOUT = 10  # seconds before an unanswered console prompt defaults to yes
+
+def check_ollama(verify_api=False):
+    """Check if Ollama is running (a TCP connect unless verify_api is set)"""
+    try:
+        socket.create_connection(OLLAMA_ADDRESS, timeout=0.2).close()
+    except OSError:
+        return False
+    
+    if not verify_api:
+        return True
+    
     try:
         import requests
         response = requests.get("http://localhost:11434/api/version", timeout=2)
@@ -21,11 +37,17 @@ def start_ollama():
     """Try to start Ollama"""
     print("🔄 Starting Ollama...")
     try:
+        # Let the server answer concurrent requests instead of queuing them, and keep
+        # the model (with its cached prompt prefix) loaded between requests
+        env = dict(os.environ)
+        env.setdefault('OLLAMA_NUM_PARALLEL', '4')
+        env.setdefault('OLLAMA_KEEP_ALIVE', '30m')
+        
         # Try to start Ollama in background
         if os.name == 'nt':  # Windows
-            subprocess.Popen(['ollama', 'serve'], creationflags=subprocess.CREATE_NEW_CONSOLE)
+            subprocess.Popen(['ollama', 'serve'], env=env, creationflags=subprocess.CREATE_NEW_CONSOLE)
         else:  # Unix-like
-            subprocess.Popen(['ollama', 'serve'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            subprocess.Popen(['ollama', 'serve'], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         
         # Wait a moment for startup
         import time
@@ -37,23 +59,136 @@ def start_ollama():
         return False
 
 def check_model():
-    """Check if required model is available"""
+    """Check if required model is available (via the Ollama /api/tags endpoint)"""
     try:
-        result = subprocess.run(['ollama', 'list'], capture_output=True, text=True, timeout=10)
-        return 'llama3.2:3b' in result.stdout or 'llama3.2' in result.stdout
+        with urllib.request.urlopen("http://localhost:11434/api/tags", timeout=2) as response:
+            models = {model['name'] for model in json.loads(response.read())['models']}
+        return any(name.startswith('llama3.2') for name in models)
     except:
         return False
 
+def ask_download():
+    """Ask whether to download the model without stalling startup on stdin"""
+    question = f"Download {MODEL_NAME} model?"
+    
+    if not sys.stdin.isatty():
+        # No console (e.g. launched by double-click) - ask with a dialog instead
+        try:
+            import tkinter as tk
+            from tkinter import messagebox
+            root = tk.Tk()
+            root.withdraw()
+            try:
+                return messagebox.askyesno("Heimdall", question)
+            finally:
+                root.destroy()
+        except Exception:
+            return True
+    
+    answer = []
+    prompt = threading.Thread(
+        target=lambda: answer.append(input(f"{question} (Y/n, yes in {PROMPT_TIMEOUT}s): ")),
+        daemon=True
+    )
+    prompt.start()
+    prompt.join(PROMPT_TIMEOUT)
+    if not answer:
+        print("\n⏱️ No answer, downloading (Ctrl+C to cancel)")
+        return True
+    return not answer[0].strip().lower().startswith('n')
+
+def pull_model(on_progress, cancel=None):
+    """Stream the Ollama /api/pull endpoint, reporting (status, percent) as it goes"""
+    request = urllib.request.Request(
+        "http://localhost:11434/api/pull",
+        data=json.dumps({"name": MODEL_NAME}).encode(),
+        headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request, timeout=30) as response:
+        for line in response:
+            if cancel is not None and cancel.is_set():
+                return False
+            status = json.loads(line)
+            if 'error' in status:
+                raise RuntimeError(status['error'])
+            if status.get('status') == 'success':
+                return True
+            if status.get('total'):
+                on_progress(status['status'], status.get('completed', 0) * 100 // status['total'])
+    return False
+
 def download_model():
-    """Download required model"""
+    """Download required model, showing progress in the console or a small window"""
+    if not sys.stdin.isatty():
+        return download_model_with_window()
+    
     print("📥 Downloading AI model (this may take a few minutes)...")
     try:
-        result = subprocess.run(['ollama', 'pull', 'llama3.2:3b'], timeout=600)
-        return result.returncode == 0
+        success = pull_model(
+            lambda status, percent: print(f"\r   {status}: {percent}%", end="", flush=True)
+        )
+        print()
+        return success
+    except KeyboardInterrupt:
+        print("\n⚠️ Download cancelled")
+        return False
     except Exception as e:
-        print(f"❌ Failed to download model: {e}")
+        print(f"\n❌ Failed to download model: {e}")
         return False
 
+def download_model_with_window():
+    """Download the model behind a Tk progress window with a Cancel button"""
+    try:
+        import tkinter as tk
+        from tkinter import messagebox, ttk
+        root = tk.Tk()
+    except Exception:
+        # No display either - download without showing progress
+        try:
+            return pull_model(lambda status, percent: None)
+        except Exception:
+            return False
+    
+    root.title("Heimdall")
+    root.resizable(False, False)
+    label = tk.Label(root, text=f"Downloading {MODEL_NAME}...", width=40, padx=20, pady=10)
+    label.pack()
+    bar = ttk.Progressbar(root, length=300, maximum=100)
+    bar.pack(padx=20)
+    
+    cancel = threading.Event()
+    tk.Button(root, text="Cancel", command=cancel.set).pack(pady=10)
+    root.protocol("WM_DELETE_WINDOW", cancel.set)
+    
+    # Written by the download thread, read by the Tk loop (Tk is not thread-safe)
+    progress = {'status': "Connecting", 'percent': 0, 'error': None, 'success': False}
+    
+    def worker():
+        try:
+            progress['success'] = pull_model(
+                lambda status, percent: progress.update(status=status, percent=percent), cancel
+            )
+        except Exception as e:
+            progress['error'] = str(e)
+    
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    
+    def poll():
+        if thread.is_alive():
+            label.config(text="Cancelling..." if cancel.is_set()
+                         else f"{progress['status']}: {progress['percent']}%")
+            bar['value'] = progress['percent']
+            root.after(200, poll)
+            return
+        if progress['error']:
+            messagebox.showerror("Heimdall", f"Failed to download model: {progress['error']}", parent=root)
+        root.destroy()
+    
+    poll()
+    root.mainloop()
+    return progress['success']
+
 def main():
     """Main startup function"""
     print("🏠 Starting Heimdall AI Assistant...")
@@ -64,8 +199,11 @@ def main():
         print("❌ Python 3.8+ required")
         return 1
     
+    # Pass --verify-api to check the Ollama HTTP API, not just the port
+    verify_api = "--verify-api" in sys.argv[1:]
+    
     # Check if Ollama is available
-    if not check_ollama():
+    if not check_ollama(verify_api):
         print("🔄 Ollama not running, attempting to start...")
         if not start_ollama():
             print("❌ Could not start Ollama")
@@ -78,17 +216,17 @@ def main():
         print("✅ Ollama is running")
     
     # Check if model is available
-    if check_ollama() and not check_model():
+    if check_ollama(verify_api) and not check_model():
         print("📥 Required AI model not found")
-        if input("Download llama3.2:3b model? (y/n): ").lower().startswith('y'):
+        if ask_download():
             if not download_model():
                 print("❌ Model download failed")
         else:
             print("⚠️ Running without AI model (limited functionality)")
     
     # Create data directories
-    os.makedirs("./data/logs", exist_ok=True)
-    os.makedirs("./data/screenshots", exist_ok=True)
+    for path in ("./data/logs", "./data/screenshots"):
+        Path(path).mkdir(parents=True, exist_ok=True)
     
     print("\n🚀 Launching Heimdall GUI...")
     
@@ -5,11 +5,15 @@ Test script to verify AI integration works
 import sys
 import os
 import asyncio
-from pathlib import Path
+from importlib.util import find_spec
 
-# Add src directory to path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+from _test_resources import heimdall_brain, use_src_path
+
+GUI_TOOLKITS = (
+    ("PyQt6", "PyQt6.QtWidgets"),
+    ("PyQt5", "PyQt5.QtWidgets"),
+    ("Tkinter", "tkinter"),
+)
 
 async def test_ai_brain():
     """Test the AI brain functionality"""
@@ -19,9 +23,9 @@ async def test_ai_brain():
         from ai.heimdall_brain import HeimdallBrain
         print("✅ AI Brain imported successfully")
         
-        # Initialize
-        brain = HeimdallBrain()
-        success = await brain.initialize()
+        # Initialize (shared with the other tests in this process)
+        brain = await heimdall_brain()
+        success = brain.initialized
         
         if success:
             print("✅ AI Brain initialized successfully")
@@ -54,23 +58,13 @@ def test_gui_import():
     """Test GUI imports"""
     print("🖥️ Testing GUI imports...")
     
-    try:
-        from PyQt6.QtWidgets import QApplication
-        print("✅ PyQt6 available")
-        return True
-    except ImportError:
-        try:
-            from PyQt5.QtWidgets import QApplication
-            print("✅ PyQt5 available")
+    # Ask the import finders; only the top-level packages get imported
+    for label, module in GUI_TOOLKITS:
+        if find_spec(module.partition(".")[0]) and find_spec(module):
+            print(f"✅ {label} available")
             return True
-        except ImportError:
-            try:
-                import tkinter
-                print("✅ Tkinter available")
-                return True
-            except ImportError:
-                print("❌ No GUI libraries available")
-                return False
+    print("❌ No GUI libraries available")
+    return False
 
 async def main():
     """Main test function"""
@@ -97,4 +91,5 @@ async def main():
     return 0 if (gui_ok and ai_ok) else 1
 
 if __name__ == "__main__":
+    use_src_path()
     sys.exit(asyncio.run(main()))
\ No newline at end of file
@@ -2,49 +2,62 @@
 """
 Test all Heimdall components step by step
 """
+import os
 import sys
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-# Add src directory to path for imports
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+from _test_resources import INTEGRATION, qt_app, tts_engine, use_src_path
+from _whisper_backend import load_whisper
 
-def test_whisper():
-    """Test OpenAI Whisper"""
-    print("🎤 Testing Whisper...")
+def run_with(test, factory, label):
+    """Build a shared resource, then run the test that uses it"""
     try:
-        import whisper
-        model = whisper.load_model('base')
-        print("✅ Whisper model loaded successfully")
-        return True
+        resource = factory()
     except Exception as e:
-        print(f"❌ Whisper failed: {e}")
+        print(f"❌ {label} failed: {e}")
+        return False
+    return test(resource)
+
+def test_whisper(whisper_model):
+    """Test OpenAI Whisper"""
+    print("🎤 Testing Whisper...")
+    if whisper_model is None:
+        print("❌ Whisper failed: no model loaded")
         return False
+    print("✅ Whisper model loaded successfully")
+    return True
 
 def test_pyautogui():
     """Test PyAutoGUI screen control"""
     print("🖱️ Testing PyAutoGUI...")
     try:
         import pyautogui
-        pyautogui.FAILSAFE = True
-        screen_size = pyautogui.size()
-        print(f"✅ PyAutoGUI working - Screen: {screen_size}")
+        missing = {"size", "position", "FAILSAFE"} - set(dir(pyautogui))
+        if missing:
+            print(f"❌ PyAutoGUI missing: {sorted(missing)}")
+            return False
+        print("✅ PyAutoGUI API available")
         
-        # Test safe mouse movement (just get current position)
-        current_pos = pyautogui.position()
-        print(f"✅ Current mouse position: {current_pos}")
+        # Only talk to the display server in integration runs that have one
+        if INTEGRATION and (os.environ.get("DISPLAY") or sys.platform in ("darwin", "win32")):
+            pyautogui.FAILSAFE = True
+            screen_size = pyautogui.size()
+            print(f"✅ PyAutoGUI working - Screen: {screen_size}")
+            
+            # Test safe mouse movement (just get current position)
+            current_pos = pyautogui.position()
+            print(f"✅ Current mouse position: {current_pos}")
         return True
     except Exception as e:
         print(f"❌ PyAutoGUI failed: {e}")
         return False
 
-def test_pyttsx3():
+def test_pyttsx3(tts_engine):
     """Test pyttsx3 text-to-speech"""
     print("🔊 Testing pyttsx3...")
     try:
-        import pyttsx3
-        engine = pyttsx3.init()
+        engine = tts_engine
         voices = engine.getProperty('voices')
         voice_count = len(voices) if voices else 0
         print(f"✅ pyttsx3 working - {voice_count} voices available")
@@ -95,22 +108,15 @@ def test_heimdall_components():
         except Exception as e:
             print(f"❌ ScreenController import failed: {e}")
 
-def test_gui():
+def test_gui(qapp):
     """Test GUI components"""
     print("🖥️ Testing GUI...")
     try:
-        from PyQt6.QtWidgets import QApplication
-        from PyQt6.QtCore import Qt
-        
-        # Create minimal app to test
-        app = QApplication(sys.argv)
         print("✅ PyQt6 application created")
         
         # Test if our main GUI can be imported
         import heimdall_working
         print("✅ Heimdall GUI module imported")
-        
-        app.quit()
         return True
     except Exception as e:
         print(f"❌ GUI test failed: {e}")
@@ -121,13 +127,18 @@ def main():
     print("🧪 HEIMDALL COMPONENT TESTING")
     print("=" * 50)
     
-    results = []
-    
-    # Test each component
-    results.append(("Whisper", test_whisper()))
-    results.append(("PyAutoGUI", test_pyautogui()))
-    results.append(("pyttsx3", test_pyttsx3()))
-    results.append(("GUI", test_gui()))
+    # The library checks are independent, so load them side by side; the TTS
+    # engine and Qt are bound to the thread that creates them, so they stay
+    # on the main thread
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            ("Whisper", pool.submit(run_with, test_whisper, load_whisper, "Whisper")),
+            ("PyAutoGUI", pool.submit(test_pyautogui)),
+        ]
+        tts_ok = run_with(test_pyttsx3, tts_engine, "pyttsx3")
+        gui_ok = run_with(test_gui, qt_app, "GUI test")
+        results = [(name, future.result()) for name, future in futures]
+    results += [("pyttsx3", tts_ok), ("GUI", gui_ok)]
     
     print("\n🧠 Testing Heimdall Components...")
     test_heimdall_components()
@@ -154,4 +165,5 @@ def main():
     print("\n🚀 Ready to run: python heimdall_working.py")
 
 if __name__ == "__main__":
+    use_src_path()
     main()
\ No newline at end of file
@@ -2,12 +2,29 @@
 """
 Test enhanced automation features including AI-powered element detection
 """
+import asyncio
 import sys
-from pathlib import Path
+from contextlib import ExitStack
+from unittest import mock
 
-# Add src directory to path for imports
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+from _test_resources import INTEGRATION, heimdall_brain, use_src_path
+
+# Test phrases, already lowercase as the parsers expect
+_WM_PHRASES = (
+    "close this window",
+    "minimize the application",
+    "maximize heimdall",
+    "close the browser",
+    "read the current window",
+)
+
+_CLICK_PHRASES = (
+    "click the close button",
+    "press the submit button",
+    "tap the ok button",
+    "select the cancel link",
+    "click the blue save button",
+)
 
 def test_element_detection():
     """Test AI-powered element detection"""
@@ -48,16 +65,8 @@ def test_window_management():
     try:
         from core.llm_wrapper import parse_intent_rules
         
-        test_commands = [
-            "close this window",
-            "minimize the application", 
-            "maximize heimdall",
-            "close the browser",
-            "read the current window"
-        ]
-        
-        for command in test_commands:
-            intent = parse_intent_rules(command.lower())
+        for command in _WM_PHRASES:
+            intent = parse_intent_rules(command)
             print(f"✅ '{command}' → {intent['action']} ({intent.get('window', 'current')})")
         
     except Exception as e:
@@ -69,20 +78,29 @@ def test_enhanced_screen_capture():
     
     try:
         from core.screen_analyzer import capture_fullscreen_and_ocr
-        
-        # Test full screen capture
-        print("  - Testing full screen capture...")
-        result = capture_fullscreen_and_ocr()
-        if result and not result.startswith("❌"):
-            print("    ✅ Full screen capture working")
-        else:
-            print(f"    ⚠️ Full screen capture issue: {result[:50]}...")
-        
-        # Test window-specific capture (will fallback to full screen if window not found)
-        print("  - Testing window-specific capture...")
-        result = capture_fullscreen_and_ocr("NonExistentWindow")
-        if result:
-            print("    ✅ Window-specific capture working (with fallback)")
+        from PIL import Image
+        
+        with ExitStack() as stack:
+            # Use a blank frame and canned OCR text unless this is an integration run
+            if not INTEGRATION:
+                frame = Image.new("RGB", (64, 64))
+                stack.enter_context(mock.patch("core.screen_analyzer.pyautogui.screenshot", return_value=frame))
+                stack.enter_context(mock.patch("core.screen_controller.capture_window_screenshot", return_value=frame))
+                stack.enter_context(mock.patch("core.screen_analyzer.pytesseract.image_to_string", return_value="OK"))
+            
+            # Test full screen capture
+            print("  - Testing full screen capture...")
+            result = capture_fullscreen_and_ocr()
+            if result and not result.startswith("❌"):
+                print("    ✅ Full screen capture working")
+            else:
+                print(f"    ⚠️ Full screen capture issue: {result[:50]}...")
+            
+            # Test window-specific capture (will fallback to full screen if window not found)
+            print("  - Testing window-specific capture...")
+            result = capture_fullscreen_and_ocr("NonExistentWindow")
+            if result:
+                print("    ✅ Window-specific capture working (with fallback)")
         
     except Exception as e:
         print(f"❌ Enhanced screen capture test failed: {e}")
@@ -94,16 +112,8 @@ def test_click_target_extraction():
     try:
         from core.llm_wrapper import extract_click_target
         
-        test_phrases = [
-            "click the close button",
-            "press the submit button",
-            "tap the ok button", 
-            "select the cancel link",
-            "click the blue save button"
-        ]
-        
-        for phrase in test_phrases:
-            target = extract_click_target(phrase.lower())
+        for phrase in _CLICK_PHRASES:
+            target = extract_click_target(phrase)
             print(f"✅ '{phrase}' → target: '{target}'")
         
     except Exception as e:
@@ -113,48 +123,77 @@ def test_ai_brain_integration():
     """Test AI brain integration with enhanced features"""
     print("\n🧠 Testing AI Brain Integration...")
     
-    try:
-        from ai.heimdall_brain import HeimdallBrain
-        import asyncio
-        
-        brain = HeimdallBrain()
-        
+    # Test enhanced commands
+    test_commands = [
+        "close this application",
+        "read what's on my screen",
+        "click the submit button"
+    ]
+    
+    async def _go():
         # Test initialization
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        success = loop.run_until_complete(brain.initialize())
+        brain = await heimdall_brain()
+        if not brain.initialized:
+            return []
+        print("✅ AI Brain initialized")
         
-        if success:
-            print("✅ AI Brain initialized")
-            
-            # Test enhanced commands
-            test_commands = [
-                "close this application",
-                "read what's on my screen",
-                "click the submit button"
-            ]
-            
-            for command in test_commands:
-                try:
-                    result = loop.run_until_complete(
-                        brain.process_message(command, simulate_actions=False)
-                    )
-                    
-                    if result and 'reply' in result:
-                        print(f"✅ '{command}' → processed successfully")
-                        intent_type = result.get('intent', {}).get('type', 'unknown')
-                        print(f"    Intent: {intent_type}")
-                    else:
-                        print(f"❌ '{command}' → processing failed")
-                        
-                except Exception as cmd_error:
-                    print(f"⚠️ '{command}' → {str(cmd_error)[:50]}...")
-        
-        loop.close()
+        # These are real desktop actions, so they run one at a time
+        results = []
+        for command in test_commands:
+            try:
+                results.append(await brain.process_message(command, simulate_actions=False))
+            except Exception as cmd_error:
+                results.append(cmd_error)
+        return results
+    
+    try:
+        for command, result in zip(test_commands, asyncio.run(_go())):
+            if isinstance(result, Exception):
+                print(f"⚠️ '{command}' → {str(result)[:50]}...")
+            elif result and 'reply' in result:
+                print(f"✅ '{command}' → processed successfully")
+                intent_type = result.get('intent', {}).get('type', 'unknown')
+                print(f"    Intent: {intent_type}")
+            else:
+                print(f"❌ '{command}' → processing failed")
         
     except Exception as e:
         print(f"❌ AI Brain integration test failed: {e}")
 
+# Printed in one write once the checks have run
+_SUMMARY = "\n".join((
+    "\n" + "=" * 50,
+    "🎯 ENHANCED FEATURES SUMMARY",
+    "=" * 50,
+
+    "✅ AI-Powered Element Detection:",
+    "   - Finds close/minimize/maximize buttons automatically",
+    "   - Detects buttons by text content using OCR",
+    "   - Locates UI elements by natural language description",
+
+    "\n✅ Window Management:",
+    "   - Close/minimize/maximize specific windows",
+    "   - Window-specific screen capture",
+    "   - Cross-platform window enumeration",
+
+    "\n✅ Enhanced Screen Analysis:",
+    "   - UI element detection and classification",
+    "   - Window-specific OCR capture",
+    "   - Intelligent preprocessing for better OCR",
+
+    "\n✅ Natural Language Processing:",
+    "   - Extract window references from commands",
+    "   - Identify click targets from descriptions",
+    "   - Intent parsing for window management",
+
+    "\n🎬 READY FOR ADVANCED DEMO!",
+    "   Try commands like:",
+    "   - 'Close this application'",
+    "   - 'Click the submit button'",
+    "   - 'Read the browser window'",
+    "   - 'Minimize Heimdall'",
+)) + "\n"
+
 def main():
     """Run all enhanced automation tests"""
     print("🚀 ENHANCED AUTOMATION TESTING")
@@ -168,36 +207,8 @@ def main():
     test_click_target_extraction()
     test_ai_brain_integration()
     
-    print("\n" + "=" * 50)
-    print("🎯 ENHANCED FEATURES SUMMARY")
-    print("=" * 50)
-    
-    print("✅ AI-Powered Element Detection:")
-    print("   - Finds close/minimize/maximize buttons automatically")
-    print("   - Detects buttons by text content using OCR")
-    print("   - Locates UI elements by natural language description")
-    
-    print("\n✅ Window Management:")
-    print("   - Close/minimize/maximize specific windows")
-    print("   - Window-specific screen capture")
-    print("   - Cross-platform window enumeration")
-    
-    print("\n✅ Enhanced Screen Analysis:")
-    print("   - UI element detection and classification")
-    print("   - Window-specific OCR capture")
-    print("   - Intelligent preprocessing for better OCR")
-    
-    print("\n✅ Natural Language Processing:")
-    print("   - Extract window references from commands")
-    print("   - Identify click targets from descriptions")
-    print("   - Intent parsing for window management")
-    
-    print("\n🎬 READY FOR ADVANCED DEMO!")
-    print("   Try commands like:")
-    print("   - 'Close this application'")
-    print("   - 'Click the submit button'")
-    print("   - 'Read the browser window'")
-    print("   - 'Minimize Heimdall'")
+    sys.stdout.write(_SUMMARY)
 
 if __name__ == "__main__":
+    use_src_path()
     main()
\ No newline at end of file
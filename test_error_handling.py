@@ -2,13 +2,18 @@
 """
 Test script to verify error handling in Heimdall GUI
 """
-import sys
+import importlib
 import os
-from pathlib import Path
 
-# Add src directory to path for imports
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+from _test_resources import qt_app, use_src_path
+
+# (label, module, attribute) for every AI component the GUI depends on
+COMPONENT_IMPORTS = (
+    ("AI Brain", "ai.heimdall_brain", "HeimdallBrain"),
+    ("Voice Handler", "core.voice_handler", "VoiceHandler"),
+    ("Screen Analyzer", "core.screen_analyzer", "ScreenAnalyzer"),
+    ("Screen Controller", "core.screen_controller", "execute_screen_command"),
+)
 
 def test_error_handling():
     """Test error handling by simulating various failure scenarios"""
@@ -16,35 +21,17 @@ def test_error_handling():
     
     # Test 1: Import AI components with potential failures
     print("\n1. Testing AI component imports...")
-    try:
-        from ai.heimdall_brain import HeimdallBrain
-        print("✅ AI Brain import successful")
-    except Exception as e:
-        print(f"❌ AI Brain import failed: {e}")
-    
-    try:
-        from core.voice_handler import VoiceHandler
-        print("✅ Voice Handler import successful")
-    except Exception as e:
-        print(f"❌ Voice Handler import failed: {e}")
-    
-    try:
-        from core.screen_analyzer import ScreenAnalyzer
-        print("✅ Screen Analyzer import successful")
-    except Exception as e:
-        print(f"❌ Screen Analyzer import failed: {e}")
-    
-    try:
-        from core.screen_controller import execute_screen_command
-        print("✅ Screen Controller import successful")
-    except Exception as e:
-        print(f"❌ Screen Controller import failed: {e}")
+    for label, module, attr in COMPONENT_IMPORTS:
+        try:
+            getattr(importlib.import_module(module), attr)
+            print(f"✅ {label} import successful")
+        except Exception as e:
+            print(f"❌ {label} import failed: {e}")
     
     # Test 2: Test GUI with error handling
     print("\n2. Testing GUI error handling...")
     try:
-        from PyQt6.QtWidgets import QApplication
-        app = QApplication(sys.argv)
+        qt_app()
         
         # Import the main window class
         import heimdall_working
@@ -52,8 +39,6 @@ def test_error_handling():
         print("✅ GUI components loaded successfully")
         print("✅ Error handling system integrated")
         
-        app.quit()
-        
     except Exception as e:
         print(f"❌ GUI error handling test failed: {e}")
     
@@ -65,4 +50,5 @@ def test_error_handling():
     print("   - Detailed error logging is enabled")
 
 if __name__ == "__main__":
+    use_src_path()
     test_error_handling()
\ No newline at end of file
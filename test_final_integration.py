@@ -2,38 +2,32 @@
 """
 Final integration test for fully wired Heimdall AI Assistant
 """
+import ast
+import asyncio
 import sys
 import time
 from pathlib import Path
 
-# Add src directory to path for imports
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+from _test_resources import heimdall_brain, use_src_path
 
 def test_ai_backend_integration():
     """Test that GUI is properly wired to AI backend"""
     print("🧠 Testing AI Backend Integration...")
     
-    try:
+    async def _go():
         # Test AI Brain import and initialization
-        from ai.heimdall_brain import HeimdallBrain
-        import asyncio
-        
-        brain = HeimdallBrain()
+        brain = await heimdall_brain()
+        if not brain.initialized:
+            return False, None
+        print("✅ AI Brain initialization successful")
         
-        # Test initialization
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        success = loop.run_until_complete(brain.initialize())
+        # Test message processing
+        return True, await brain.process_message("Hello, can you help me?")
+    
+    try:
+        success, result = asyncio.run(_go())
         
         if success:
-            print("✅ AI Brain initialization successful")
-            
-            # Test message processing
-            result = loop.run_until_complete(
-                brain.process_message("Hello, can you help me?")
-            )
-            
             if isinstance(result, dict) and 'reply' in result:
                 print("✅ AI message processing working")
                 print(f"   Sample reply: {result['reply'][:50]}...")
@@ -42,8 +36,6 @@ def test_ai_backend_integration():
         else:
             print("❌ AI Brain initialization failed")
         
-        loop.close()
-        
     except Exception as e:
         print(f"❌ AI Backend test failed: {e}")
 
@@ -142,46 +134,58 @@ def test_gui_integration():
     print("\n🖥️ Testing GUI Integration...")
     
     try:
-        # Test GUI imports
-        from PyQt6.QtWidgets import QApplication
-        import heimdall_working
-        
-        print("✅ GUI modules imported successfully")
-        print("✅ Heimdall working module loaded")
-        
-        # Test that GUI has all the required methods by checking the run_pyqt6 function
-        try:
-            # The GUI class is defined inside run_pyqt6 function, so we can't access it directly
-            # Instead, let's verify the GUI can be imported and contains the expected structure
-            import inspect
-            source = inspect.getsource(heimdall_working.run_pyqt6)
-            
-            required_methods = [
-                'show_error_bubble',
-                'handle_ai_response', 
-                'handle_voice_result',
-                'handle_screen_result',
-                'execute_automation_action',
-                'speak_response'
-            ]
-            
-            missing_methods = []
-            for method in required_methods:
-                if f"def {method}" not in source:
-                    missing_methods.append(method)
-            
-            if not missing_methods:
-                print("✅ All required GUI methods present")
-            else:
-                print(f"❌ Missing GUI methods: {missing_methods}")
-                
-        except Exception as e:
-            print(f"⚠️ Could not verify GUI methods: {e}")
-            print("✅ GUI structure verification skipped")
+        # Read the window class from source; importing heimdall_working would start up Qt
+        tree = ast.parse((Path(__file__).parent / "heimdall_working.py").read_text(encoding="utf-8"))
+        window_cls = next(
+            node for node in ast.walk(tree)
+            if isinstance(node, ast.ClassDef) and node.name == "HeimdallWindow"
+        )
+        print("✅ HeimdallWindow class found")
+        
+        required_methods = {
+            'show_error_bubble',
+            'handle_ai_response', 
+            'handle_voice_result',
+            'handle_screen_result',
+            'execute_automation_action',
+            'speak_response'
+        }
+        
+        defined = {
+            node.name for node in window_cls.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        }
+        missing_methods = sorted(required_methods - defined)
+        
+        if not missing_methods:
+            print("✅ All required GUI methods present")
+        else:
+            print(f"❌ Missing GUI methods: {missing_methods}")
         
     except Exception as e:
         print(f"❌ GUI integration test failed: {e}")
 
+# Printed in one write once the checks have run
+_SUMMARY = "\n".join((
+    "\n" + "=" * 50,
+    "🎯 INTEGRATION TEST SUMMARY",
+    "=" * 50,
+
+    "✅ AI Backend: Fully integrated with real process_message() calls",
+    "✅ Voice Input: Wired to voice_handler.listen_and_transcribe()",
+    "✅ Screen Reading: Connected to screen_analyzer.capture_and_read()",
+    "✅ Automation: Linked to screen_controller.execute() (simulated)",
+    "✅ TTS Output: AI responses spoken with pyttsx3",
+    "✅ Error Handling: Red error bubbles for all failures",
+    "✅ GUI Integration: All components properly wired",
+
+    "\n🚀 READY FOR DEPLOYMENT!",
+    "   Run: python heimdall_working.py",
+    "   - Works immediately with graceful fallbacks",
+    "   - Install optional dependencies for full features",
+    "   - Comprehensive error handling prevents crashes",
+)) + "\n"
+
 def main():
     """Run all integration tests"""
     print("🧪 HEIMDALL FINAL INTEGRATION TEST")
@@ -196,23 +200,8 @@ def main():
     test_llm_wrapper_integration()
     test_gui_integration()
     
-    print("\n" + "=" * 50)
-    print("🎯 INTEGRATION TEST SUMMARY")
-    print("=" * 50)
-    
-    print("✅ AI Backend: Fully integrated with real process_message() calls")
-    print("✅ Voice Input: Wired to voice_handler.listen_and_transcribe()")
-    print("✅ Screen Reading: Connected to screen_analyzer.capture_and_read()")
-    print("✅ Automation: Linked to screen_controller.execute() (simulated)")
-    print("✅ TTS Output: AI responses spoken with pyttsx3")
-    print("✅ Error Handling: Red error bubbles for all failures")
-    print("✅ GUI Integration: All components properly wired")
-    
-    print("\n🚀 READY FOR DEPLOYMENT!")
-    print("   Run: python heimdall_working.py")
-    print("   - Works immediately with graceful fallbacks")
-    print("   - Install optional dependencies for full features")
-    print("   - Comprehensive error handling prevents crashes")
+    sys.stdout.write(_SUMMARY)
 
 if __name__ == "__main__":
+    use_src_path()
     main()
\ No newline at end of file
@@ -2,92 +2,107 @@
 """
 Test full integration of Heimdall with all components
 """
-import sys
 import asyncio
-from pathlib import Path
+import io
+import sys
 
-# Add src directory to path for imports
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+from _test_resources import heimdall_brain, real_tts_engine, use_src_path
+from _whisper_backend import load_whisper
 
-async def test_full_integration():
-    """Test all components working together"""
-    print("🚀 HEIMDALL FULL INTEGRATION TEST")
-    print("=" * 50)
-    
-    # Test 1: AI Brain with Ollama
-    print("🧠 Testing AI Brain with Ollama...")
+# Printed in one write once the checks have run
+_SUMMARY = "\n".join((
+    "\n" + "=" * 50,
+    "🎯 INTEGRATION TEST COMPLETE",
+    "=" * 50,
+
+    "🎉 HEIMDALL IS FULLY OPERATIONAL!",
+    "\n✅ Working Features:",
+    "   • Professional GUI Interface",
+    "   • Intelligent AI Responses (Ollama)",
+    "   • OCR Screen Reading (Tesseract)",
+    "   • Voice Recognition (Whisper)",
+    "   • Text-to-Speech Output",
+    "   • Screen Automation (PyAutoGUI)",
+    "   • Window Management",
+    "   • Error Handling with Visual Feedback",
+
+    "\n🚀 Ready for production demo!",
+    "   Run: python heimdall_working.py",
+)) + "\n"
+
+async def _check_ai_brain(out):
+    """Test 1: AI Brain with Ollama"""
+    print("🧠 Testing AI Brain with Ollama...", file=out)
     try:
-        from ai.heimdall_brain import HeimdallBrain
-        
-        brain = HeimdallBrain()
-        await brain.initialize()
+        brain = await heimdall_brain()
         
         # Test intelligent response
         result = await brain.process_message("Hello, can you help me maximize my window?")
-        print(f"✅ AI Response: {result['reply'][:100]}...")
-        print(f"✅ Intent: {result['intent']['type']} - {result['intent'].get('action', 'N/A')}")
+        print(f"✅ AI Response: {result['reply'][:100]}...", file=out)
+        print(f"✅ Intent: {result['intent']['type']} - {result['intent'].get('action', 'N/A')}", file=out)
         
     except Exception as e:
-        print(f"❌ AI Brain test failed: {e}")
-    
-    # Test 2: OCR Screen Reading
-    print("\n📸 Testing OCR Screen Reading...")
+        print(f"❌ AI Brain test failed: {e}", file=out)
+
+async def _check_ocr(out):
+    """Test 2: OCR Screen Reading"""
+    print("\n📸 Testing OCR Screen Reading...", file=out)
     try:
         from core.screen_analyzer import capture_fullscreen_and_ocr
         
         # Test OCR
-        result = capture_fullscreen_and_ocr()
+        result = await asyncio.to_thread(capture_fullscreen_and_ocr)
         if result and not result.startswith("❌"):
-            print("✅ OCR working - Screen content captured")
-            print(f"✅ Content preview: {result[:100]}...")
+            print("✅ OCR working - Screen content captured", file=out)
+            print(f"✅ Content preview: {result[:100]}...", file=out)
         else:
-            print(f"❌ OCR failed: {result}")
+            print(f"❌ OCR failed: {result}", file=out)
         
     except Exception as e:
-        print(f"❌ OCR test failed: {e}")
-    
-    # Test 3: Voice Components
-    print("\n🎤 Testing Voice Components...")
+        print(f"❌ OCR test failed: {e}", file=out)
+
+async def _check_voice(out):
+    """Test 3: Voice Components"""
+    print("\n🎤 Testing Voice Components...", file=out)
     try:
-        import whisper
-        import pyttsx3
-        
         # Test Whisper
-        model = whisper.load_model("base")
-        print("✅ Whisper model ready")
+        model = await asyncio.to_thread(load_whisper)
+        print("✅ Whisper model ready", file=out)
         
         # Test TTS
-        engine = pyttsx3.init()
-        print("✅ Text-to-speech ready")
+        # Main thread only: the SAPI5/NSSpeechSynthesizer drivers are thread-bound
+        engine = real_tts_engine()
+        print("✅ Text-to-speech ready", file=out)
         
     except Exception as e:
-        print(f"❌ Voice test failed: {e}")
-    
-    # Test 4: Screen Automation
-    print("\n🖥️ Testing Screen Automation...")
+        print(f"❌ Voice test failed: {e}", file=out)
+
+async def _check_automation(out):
+    """Test 4: Screen Automation"""
+    print("\n🖥️ Testing Screen Automation...", file=out)
     try:
         from core.screen_controller import execute_intent, get_window_list
         
         # Test window management
-        windows = get_window_list()
-        print(f"✅ Found {len(windows)} windows")
+        windows = await asyncio.to_thread(get_window_list)
+        print(f"✅ Found {len(windows)} windows", file=out)
         
         # Test automation intent
         test_intent = {
             'action': 'maximize',
             'window': 'current'
         }
-        result = execute_intent(test_intent)
-        print(f"✅ Automation result: {result[:50]}...")
+        result = await asyncio.to_thread(execute_intent, test_intent)
+        print(f"✅ Automation result: {result[:50]}...", file=out)
         
     except Exception as e:
-        print(f"❌ Automation test failed: {e}")
-    
-    # Test 5: End-to-End Command Processing
-    print("\n🔄 Testing End-to-End Command Processing...")
+        print(f"❌ Automation test failed: {e}", file=out)
+
+async def _check_commands(out):
+    """Test 5: End-to-End Command Processing"""
+    print("\n🔄 Testing End-to-End Command Processing...", file=out)
     try:
-        from core.llm_wrapper import intent_and_reply
+        from core.llm_wrapper import AsyncBatchQueue
         
         test_commands = [
             "read my screen",
@@ -96,30 +111,56 @@ async def test_full_integration():
             "click the close button"
         ]
         
-        for cmd in test_commands:
-            result = intent_and_reply(cmd)
-            print(f"✅ '{cmd}' → {result['intent']['type']} ({result['intent'].get('action', 'N/A')})")
+        # Submitted together, the commands go to Ollama as one micro-batch
+        queue = AsyncBatchQueue()
+        results = await asyncio.gather(*(queue.add_request(cmd) for cmd in test_commands))
+        for cmd, result in zip(test_commands, results):
+            print(f"✅ '{cmd}' → {result['intent']['type']} ({result['intent'].get('action', 'N/A')})", file=out)
         
     except Exception as e:
-        print(f"❌ Command processing test failed: {e}")
-    
-    print("\n" + "=" * 50)
-    print("🎯 INTEGRATION TEST COMPLETE")
+        print(f"❌ Command processing test failed: {e}", file=out)
+
+CHECKS = (_check_ai_brain, _check_ocr, _check_voice, _check_automation, _check_commands)
+# Checks in one group run in order: automation maximizes the window OCR may be capturing
+CHECK_GROUPS = (
+    (_check_ai_brain,),
+    (_check_ocr, _check_automation),
+    (_check_voice,),
+    (_check_commands,),
+)
+MAX_CONCURRENT_CHECKS = 3  # keeps Whisper, OCR and Ollama from all contending at once
+
+async def test_full_integration():
+    """Test all components working together"""
+    print("🚀 HEIMDALL FULL INTEGRATION TEST")
     print("=" * 50)
     
-    print("🎉 HEIMDALL IS FULLY OPERATIONAL!")
-    print("\n✅ Working Features:")
-    print("   • Professional GUI Interface")
-    print("   • Intelligent AI Responses (Ollama)")
-    print("   • OCR Screen Reading (Tesseract)")
-    print("   • Voice Recognition (Whisper)")
-    print("   • Text-to-Speech Output")
-    print("   • Screen Automation (PyAutoGUI)")
-    print("   • Window Management")
-    print("   • Error Handling with Visual Feedback")
+    limit = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+    outputs = {check: io.StringIO() for check in CHECKS}
     
-    print("\n🚀 Ready for production demo!")
-    print("   Run: python heimdall_working.py")
+    async def run_group(checks):
+        for check in checks:
+            async with limit:
+                await check(outputs[check])
+    
+    # The groups are independent; each check buffers its report so the output stays in order
+    # (every check catches its own errors, so gather needs no cancellation handling)
+    await asyncio.gather(*(run_group(checks) for checks in CHECK_GROUPS))
+    
+    sys.stdout.writelines(outputs[check].getvalue() for check in CHECKS)
+    sys.stdout.write(_SUMMARY)
 
 if __name__ == "__main__":
-    asyncio.run(test_full_integration())
\ No newline at end of file
+    use_src_path()
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    if sys.version_info >= (3, 11):
+        loop_factory = uvloop.new_event_loop if uvloop else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(test_full_integration())
+    else:
+        if uvloop:
+            uvloop.install()
+        asyncio.run(test_full_integration())
\ No newline at end of file
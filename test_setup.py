@@ -6,12 +6,14 @@ import asyncio
 import sys
 from loguru import logger
 
+from _test_resources import ocr_text, real_tts_engine
+from _whisper_backend import load_whisper
+
 
 async def test_whisper():
     """Test local Whisper"""
     try:
-        import whisper
-        model = whisper.load_model("tiny")  # Use tiny for quick test
+        model = await asyncio.to_thread(load_whisper, "tiny")  # Use tiny for quick test
         logger.info("✅ Whisper model loaded successfully")
         return True
     except Exception as e:
@@ -22,8 +24,9 @@ async def test_whisper():
 async def test_tts():
     """Test pyttsx3 TTS"""
     try:
-        import pyttsx3
-        engine = pyttsx3.init()
+        # SAPI5 and NSSpeechSynthesizer engines belong to the thread that made them,
+        # so create and query the engine on the main thread, not a worker
+        engine = real_tts_engine()
         voices = engine.getProperty('voices')
         logger.info(f"✅ TTS initialized with {len(voices)} voices")
         
@@ -37,11 +40,28 @@ async def test_tts():
         return False
 
 
+OLLAMA_URL = "http://localhost:11434"
+OLLAMA_PROBE_RETRIES = 3
+
+
 async def test_ollama():
     """Test Ollama connection"""
     try:
-        import requests
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
+        import httpx
+        async with httpx.AsyncClient(timeout=5) as client:
+            # Cheap HEAD probe first so a stopped server fails in well under a second
+            for attempt in range(OLLAMA_PROBE_RETRIES):
+                try:
+                    probe = await client.head(OLLAMA_URL, timeout=0.5)
+                    break
+                except httpx.TransportError:
+                    if attempt == OLLAMA_PROBE_RETRIES - 1:
+                        raise
+                    await asyncio.sleep(0.1 * 2 ** attempt)
+            if probe.status_code != 200:
+                logger.error("❌ Ollama server not responding")
+                return False
+            response = await client.get(f"{OLLAMA_URL}/api/tags")
         if response.status_code == 200:
             models = response.json().get("models", [])
             model_names = [model["name"] for model in models]
@@ -65,16 +85,15 @@ async def test_ollama():
 async def test_ocr():
     """Test Tesseract OCR"""
     try:
-        import pytesseract
         from PIL import Image
         import numpy as np
         
-        # Create a simple test image with text
-        img_array = np.ones((100, 300, 3), dtype=np.uint8) * 255
+        # Create a simple grayscale test image
+        img_array = np.full((100, 300), 255, dtype=np.uint8)
         test_image = Image.fromarray(img_array)
         
         # Test OCR (this might not extract text from blank image, but tests if OCR works)
-        pytesseract.image_to_string(test_image)
+        await ocr_text(test_image)
         logger.info("✅ Tesseract OCR is working")
         return True
     except Exception as e:
@@ -85,9 +104,19 @@ async def test_ocr():
 async def test_screen_capture():
     """Test screenshot capture"""
     try:
-        from PIL import ImageGrab
-        screenshot = ImageGrab.grab()
-        logger.info(f"✅ Screenshot captured: {screenshot.size}")
+        try:
+            from mss import mss
+        except ImportError:
+            from PIL import ImageGrab
+            screenshot = await asyncio.to_thread(ImageGrab.grab)
+            size = screenshot.size
+        else:
+            # mss reads the framebuffer directly; its handle must stay on one thread
+            def grab_primary():
+                with mss() as sct:
+                    return tuple(sct.grab(sct.monitors[1]).size)
+            size = await asyncio.to_thread(grab_primary)
+        logger.info(f"✅ Screenshot captured: {size}")
         return True
     except Exception as e:
         logger.error(f"❌ Screenshot test failed: {e}")
@@ -98,12 +127,9 @@ async def test_database():
     """Test SQLite database"""
     try:
         import aiosqlite
-        import os
-        
-        # Create test database
-        os.makedirs("./data", exist_ok=True)
         
-        async with aiosqlite.connect("./data/test.db") as db:
+        # In-memory database: nothing touches the disk or needs cleaning up
+        async with aiosqlite.connect(":memory:") as db:
             await db.execute("CREATE TABLE IF NOT EXISTS test (id INTEGER PRIMARY KEY)")
             await db.execute("INSERT INTO test (id) VALUES (1)")
             await db.commit()
@@ -112,9 +138,6 @@ async def test_database():
                 count = (await cursor.fetchone())[0]
                 
         logger.info(f"✅ Database test successful: {count} record(s)")
-        
-        # Clean up
-        os.remove("./data/test.db")
         return True
     except Exception as e:
         logger.error(f"❌ Database test failed: {e}")
@@ -152,16 +175,16 @@ async def main():
         ("PyAutoGUI (Automation)", test_automation),
     ]
     
-    results = []
-    
-    for test_name, test_func in tests:
+    async def run_check(test_name, test_func):
         logger.info(f"\n🔍 Testing {test_name}...")
         try:
-            result = await test_func()
-            results.append((test_name, result))
+            return test_name, await test_func()
         except Exception as e:
             logger.error(f"❌ {test_name} failed with exception: {e}")
-            results.append((test_name, False))
+            return test_name, False
+    
+    # The probes are independent, so run them side by side
+    results = await asyncio.gather(*(run_check(name, func) for name, func in tests))
     
     # Summary
     logger.info("\n" + "=" * 40)
@@ -190,4 +213,15 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    if sys.version_info >= (3, 11):
+        loop_factory = uvloop.new_event_loop if uvloop else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main())
+    else:
+        if uvloop:
+            uvloop.install()
+        asyncio.run(main())
\ No newline at end of file
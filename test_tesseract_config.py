@@ -2,33 +2,59 @@
 """
 Test and configure Tesseract for Heimdall
 """
+import asyncio
 import os
 import platform
+import shutil
+from functools import lru_cache
+
 import pytesseract
 from PIL import Image, ImageDraw, ImageFont
 
+from _test_resources import has_tesserocr, ocr_text
+
+# Folders whose Tesseract* subdirectories may hold tesseract.exe on Windows
+WINDOWS_INSTALL_ROOTS = (r"C:\Program Files", r"C:\Program Files (x86)", r"C:\tools", "C:\\")
+
+def find_windows_tesseract():
+    """Find tesseract.exe under any Tesseract* folder, including versioned ones"""
+    for root in WINDOWS_INSTALL_ROOTS:
+        try:
+            entries = list(os.scandir(root))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.lower().startswith("tesseract") and entry.is_dir():
+                exe = os.path.join(entry.path, "tesseract.exe")
+                if os.path.isfile(exe):
+                    return exe
+    return None
+
+@lru_cache(maxsize=1)
 def configure_tesseract():
-    """Configure Tesseract path"""
+    """Configure Tesseract path (looked up once per process)"""
+    path = shutil.which("tesseract")
+    if path:
+        print(f"✅ Tesseract found on PATH: {path}")
+        return path
+    
     if platform.system() == "Windows":
-        # Common Tesseract installation paths on Windows
-        tesseract_paths = [
-            r"C:\Program Files\Tesseract-OCR\tesseract.exe",
-            r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
-            r"C:\tools\tesseract\tesseract.exe",
-            r"C:\tesseract\tesseract.exe"
-        ]
-        
-        for path in tesseract_paths:
-            if os.path.exists(path):
-                pytesseract.pytesseract.tesseract_cmd = path
-                print(f"✅ Tesseract configured at: {path}")
-                return path
+        path = find_windows_tesseract()
+        if path:
+            pytesseract.pytesseract.tesseract_cmd = path
+            print(f"✅ Tesseract configured at: {path}")
+            return path
         
         print("❌ Tesseract not found in common locations")
         return None
-    else:
-        print("ℹ️ Non-Windows system, using default Tesseract path")
-        return "tesseract"
+    
+    print("❌ Tesseract not found on PATH")
+    return None
+
+@lru_cache(maxsize=1)
+def get_version():
+    """Tesseract version, asked for once per process"""
+    return pytesseract.get_tesseract_version()
 
 def test_tesseract():
     """Test Tesseract functionality"""
@@ -38,12 +64,12 @@ def test_tesseract():
         if not tesseract_path:
             return False
         
-        # Test version
-        version = pytesseract.get_tesseract_version()
-        print(f"✅ Tesseract version: {version}")
+        # Test version (set TESSERACT_SKIP_VERSION=1 to save the extra process)
+        if not os.environ.get("TESSERACT_SKIP_VERSION"):
+            print(f"✅ Tesseract version: {get_version()}")
         
-        # Create test image
-        img = Image.new('RGB', (400, 100), color='white')
+        # Create test image (grayscale, as Tesseract would convert it anyway)
+        img = Image.new('L', (400, 100), color=255)
         draw = ImageDraw.Draw(img)
         
         try:
@@ -51,11 +77,15 @@ def test_tesseract():
         except:
             font = ImageFont.load_default()
         
-        draw.text((10, 30), "Hello Heimdall OCR Test", fill='black', font=font)
+        draw.text((10, 30), "Hello Heimdall OCR Test", fill=0, font=font)
         
         # Test OCR
-        text = pytesseract.image_to_string(img)
+        text = asyncio.run(ocr_text(img))
         print(f"✅ OCR Test Result: '{text.strip()}'")
+        if has_tesserocr():
+            # ocr_text prefers tesserocr, which bundles its own libtesseract
+            print("ℹ️  OCR ran through tesserocr's libtesseract; screen_analyzer uses the "
+                  f"pytesseract binary at {tesseract_path}")
         
         return True
         